@@ -48,6 +48,14 @@ from dot.models import (
 if TYPE_CHECKING:
     from types import FrameType
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 # =============================================================================
 # Console Setup
 # =============================================================================
@@ -223,6 +231,7 @@ def save_draft() -> bool:
     try:
         content = yaml.dump(
             wizard_state_to_dict(_wizard_state),
+            Dumper=_SafeDumper,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
@@ -621,6 +630,7 @@ def wizard_preview(state: WizardState) -> None:
 
     yaml_str = yaml.dump(
         data,
+        Dumper=_SafeDumper,
         default_flow_style=False,
         sort_keys=False,
         allow_unicode=True,
@@ -725,7 +735,7 @@ def build_manifest(state: WizardState) -> Manifest:
         frame = Frame(
             name=wf.name,
             source=source,
-            hooks=list(hooks),
+            hooks=tuple(hooks),
         )
         frames.append(frame)
 
@@ -754,9 +764,9 @@ def build_manifest(state: WizardState) -> Manifest:
     return Manifest(
         manifest_version="1.0.0",
         schema_version="1.0.0",
-        frames=list(frames),
-        concepts=concepts,
-        keysets=keysets,
+        frames=tuple(frames),
+        concepts=tuple(concepts),
+        keysets=tuple(keysets),
     )
 
 
@@ -839,7 +849,7 @@ def load_seed_config(path: Path) -> dict[str, Any]:
 
     try:
         with path.open("r", encoding="utf-8") as f:
-            data: dict[str, Any] = yaml.safe_load(f)
+            data: dict[str, Any] = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in seed file: {e}") from e
 
@@ -968,7 +978,7 @@ def build_manifest_from_seed(seed: dict[str, Any]) -> Manifest:
         frame = Frame(
             name=frame_name,
             source=source,
-            hooks=list(hooks),
+            hooks=tuple(hooks),
         )
         frames.append(frame)
 
@@ -997,9 +1007,9 @@ def build_manifest_from_seed(seed: dict[str, Any]) -> Manifest:
     return Manifest(
         manifest_version="1.0.0",
         schema_version="1.0.0",
-        frames=list(frames),
-        concepts=concepts,
-        keysets=keysets,
+        frames=tuple(frames),
+        concepts=tuple(concepts),
+        keysets=tuple(keysets),
     )
 
 
@@ -1031,7 +1041,7 @@ def build_manifest_from_flags(concept: str, source: str) -> Manifest:
     frame = Frame(
         name=frame_name,
         source=Source(relation=relation),
-        hooks=[hook],
+        hooks=(hook,),
     )
 
     # Build concepts list (FR-037, FR-037a)
@@ -1063,9 +1073,9 @@ def build_manifest_from_flags(concept: str, source: str) -> Manifest:
     return Manifest(
         manifest_version="1.0.0",
         schema_version="1.0.0",
-        frames=[frame],
-        concepts=concepts,
-        keysets=keysets,
+        frames=(frame,),
+        concepts=tuple(concepts),
+        keysets=tuple(keysets),
     )
 
 
@@ -6,7 +6,6 @@ T069-T072a: Implement validate command with diagnostic output,
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -18,6 +17,7 @@ from dot.core.validation import (
     has_errors,
     validate_manifest,
 )
+from dot.io.json import dumps_json
 from dot.io.yaml import ParseError, load_manifest_yaml
 from dot.models.diagnostic import Diagnostic, Severity
 
@@ -63,7 +63,7 @@ def validate(
 
     # Try to parse and validate
     try:
-        manifest, raw_data = load_manifest_yaml(manifest_path, return_raw=True)
+        diagnostics = validate_file(manifest_path)
     except ParseError as e:
         if json_output:
             _output_json(
@@ -84,9 +84,6 @@ def validate(
             typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1)
 
-    # Run validation
-    diagnostics = validate_manifest(manifest, raw_data=raw_data)
-
     # Prepare output
     errors = filter_errors(diagnostics)
     warnings = filter_warnings(diagnostics)
@@ -103,9 +100,30 @@ def validate(
     raise typer.Exit(code=0)
 
 
+def validate_file(path: Path) -> list[Diagnostic]:
+    """Load a YAML manifest and return its validation diagnostics.
+
+    Library entry point for the validate command, without any output or
+    exit code handling.
+
+    Args:
+        path: Path to the manifest YAML file.
+
+    Returns:
+        List of all diagnostics (errors and warnings).
+
+    Raises:
+        FileNotFoundError: If file does not exist.
+        ParseError: If YAML syntax is invalid.
+        pydantic.ValidationError: If data does not match schema.
+    """
+    manifest, raw_data = load_manifest_yaml(path, return_raw=True)
+    return validate_manifest(manifest, raw_data=raw_data)
+
+
 def _output_json(data: dict[str, Any]) -> None:
-    """Output JSON data to stdout."""
-    typer.echo(json.dumps(data, indent=2))
+    """Output JSON data to stdout, with non-ASCII characters escaped."""
+    typer.echo(dumps_json(data, ensure_ascii=True))
 
 
 def _output_json_diagnostics(
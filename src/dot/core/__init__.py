@@ -9,9 +9,11 @@ from dot.core.normalization import (
     is_valid_semver,
 )
 from dot.core.registry import (
+    RegistryBundle,
     derive_concepts,
     derive_hook_registry,
     derive_key_sets,
+    derive_registries,
 )
 from dot.core.validation import (
     filter_errors,
@@ -31,6 +33,8 @@ __all__ = [
     "derive_concepts",
     "derive_hook_registry",
     "derive_key_sets",
+    "derive_registries",
+    "RegistryBundle",
     # expression
     "validate_expr",
     # validation
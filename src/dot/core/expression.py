@@ -5,6 +5,7 @@ T030: Implement expr validation (allowed tokens, forbidden patterns regex)
 Spec Reference: data-model.md §Expression Validation
 """
 
+import functools
 import re
 
 from dot.models.diagnostic import Diagnostic, Severity
@@ -35,6 +36,27 @@ FORBIDDEN_PATTERNS = [
     (re.compile(r"\bTRUNCATE\b", re.IGNORECASE), "TRUNCATE"),
 ]
 
+# Word-level index of FORBIDDEN_PATTERNS (value = priority, i.e. list index).
+# Every pattern is \bWORD\b or \bWORD\s+WORD\b, so an expression can be
+# checked by splitting it into \w+ runs once and looking each run up.
+_WORD = re.compile(r"\w+")
+
+
+def _index_forbidden_words() -> tuple[dict[str, int], dict[tuple[str, str], int]]:
+    """Map forbidden single words and word pairs to their pattern priority."""
+    words: dict[str, int] = {}
+    pairs: dict[tuple[str, str], int] = {}
+    for priority, (_, name) in enumerate(FORBIDDEN_PATTERNS):
+        first, *rest = name.split()
+        if rest:
+            pairs[(first, rest[0])] = priority
+        else:
+            words[first] = priority
+    return words, pairs
+
+
+_FORBIDDEN_WORDS, _FORBIDDEN_WORD_PAIRS = _index_forbidden_words()
+
 
 def validate_expr(expr: str, path: str = "expr") -> list[Diagnostic]:
     """Validate that expr is a pure SQL expression (Manifest SQL subset).
@@ -45,11 +67,11 @@ def validate_expr(expr: str, path: str = "expr") -> list[Diagnostic]:
 
     Returns empty list if valid, list of diagnostics if invalid.
     """
-    diagnostics: list[Diagnostic] = []
-
-    # Check for empty or whitespace-only
-    if not expr or not expr.strip():
-        diagnostics.append(
+    # Check for empty or whitespace-only before any scanning (isspace does
+    # not build a stripped copy). A fresh list is returned per call because
+    # the path differs and callers extend what they get back.
+    if not expr or expr.isspace():
+        return [
             Diagnostic(
                 rule_id="HOOK-006",
                 severity=Severity.ERROR,
@@ -57,24 +79,50 @@ def validate_expr(expr: str, path: str = "expr") -> list[Diagnostic]:
                 path=path,
                 fix="Provide a valid SQL expression for the business key",
             )
+        ]
+
+    # Check for forbidden patterns (first match only, to avoid noise)
+    name = _find_forbidden_pattern(expr)
+    if name is None:
+        return []
+
+    return [
+        Diagnostic(
+            rule_id="HOOK-006",
+            severity=Severity.ERROR,
+            message=f"Expression contains forbidden pattern: {name}. "
+            f"Only pure expressions are allowed (Manifest SQL subset)",
+            path=path,
+            fix=f"Remove {name} and use only column references, literals, "
+            f"operators, CASE, CAST, and allowed functions",
         )
-        return diagnostics
-
-    # Check for forbidden patterns
-    for pattern, name in FORBIDDEN_PATTERNS:
-        if pattern.search(expr):
-            diagnostics.append(
-                Diagnostic(
-                    rule_id="HOOK-006",
-                    severity=Severity.ERROR,
-                    message=f"Expression contains forbidden pattern: {name}. "
-                    f"Only pure expressions are allowed (Manifest SQL subset)",
-                    path=path,
-                    fix=f"Remove {name} and use only column references, literals, "
-                    f"operators, CASE, CAST, and allowed functions",
-                )
-            )
-            # Return early on first forbidden pattern to avoid noise
-            return diagnostics
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_forbidden_pattern(expr: str) -> str | None:
+    """Return the name of the first forbidden pattern in expr, if any.
+
+    Memoized on expr alone: manifests repeat the same expressions across
+    many hooks, while the diagnostic path differs per call site.
+    """
+    # Report by pattern priority (list order), not position in the string
+    best: int | None = None
+    previous = ""
+    previous_end = 0
+    for match in _WORD.finditer(expr):
+        word = match.group().upper()
+        priority = _FORBIDDEN_WORDS.get(word)
+        # Two-word patterns (GROUP BY, ORDER BY) allow only whitespace between
+        if priority is None and expr[previous_end : match.start()].isspace():
+            priority = _FORBIDDEN_WORD_PAIRS.get((previous, word))
+        if priority is not None and (best is None or priority < best):
+            best = priority
+            if best == 0:
+                break
+        previous = word
+        previous_end = match.end()
 
-    return diagnostics
+    if best is None:
+        return None
+    return FORBIDDEN_PATTERNS[best][1]
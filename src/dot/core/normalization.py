@@ -6,40 +6,43 @@ is_valid_hook_name, is_valid_frame_name, is_valid_semver)
 Spec Reference: data-model.md §Naming Conventions
 """
 
+import functools
 import re
 
-# Compiled regex patterns for performance
-# lower_snake_case: starts with letter, followed by letters/digits/underscores,
-# ending with letter/digit
-LOWER_SNAKE_CASE = re.compile(r"^[a-z][a-z0-9_]*$")
-UPPER_SNAKE_CASE = re.compile(r"^[A-Z][A-Z0-9_]*$")
+# Memo size for validators whose inputs repeat across a manifest (hook names,
+# concepts, source systems); frame names and versions are unique per manifest
+_CACHE_SIZE = 2048
+
+# Compiled regex patterns for performance; used with fullmatch, since a
+# "$"-anchored match would also accept a trailing newline
 # Hook name: _hk__<concept> or _wk__<concept> optionally followed by __<qualifier>
 # concept and qualifier must be lower_snake_case without trailing underscore
-HOOK_NAME = re.compile(r"^_(hk|wk)__[a-z][a-z0-9]*(_[a-z0-9]+)*(__[a-z][a-z0-9]*(_[a-z0-9]+)*)?$")
-FRAME_NAME = re.compile(r"^[a-z][a-z0-9_]*\.[a-z][a-z0-9_]*$")
-SEMVER = re.compile(r"^\d+\.\d+\.\d+$")
+HOOK_NAME = re.compile(r"_(hk|wk)__[a-z][a-z0-9]*(_[a-z0-9]+)*(__[a-z][a-z0-9]*(_[a-z0-9]+)*)?")
+FRAME_NAME = re.compile(r"[a-z][a-z0-9_]*\.[a-z][a-z0-9_]*")
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def is_lower_snake_case(s: str) -> bool:
     """Check if string matches lower_snake_case pattern.
 
     Examples: customer, order_line, abc_123
     """
-    if not s:
-        return False
-    return bool(LOWER_SNAKE_CASE.match(s))
+    # An ASCII identifier not starting with "_" is [A-Za-z][A-Za-z0-9_]*;
+    # islower() then rules out capitals (the first letter is cased)
+    return s.isascii() and s.isidentifier() and s[0] != "_" and s.islower()
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def is_upper_snake_case(s: str) -> bool:
     """Check if string matches UPPER_SNAKE_CASE pattern.
 
     Examples: CRM, SAP, SAP_FIN
     """
-    if not s:
-        return False
-    return bool(UPPER_SNAKE_CASE.match(s))
+    # Mirror of is_lower_snake_case
+    return s.isascii() and s.isidentifier() and s[0] != "_" and s.isupper()
 
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def is_valid_hook_name(s: str) -> bool:
     """Check if string matches hook name pattern.
 
@@ -48,7 +51,7 @@ def is_valid_hook_name(s: str) -> bool:
     """
     if not s:
         return False
-    return bool(HOOK_NAME.match(s))
+    return bool(HOOK_NAME.fullmatch(s))
 
 
 def is_valid_frame_name(s: str) -> bool:
@@ -59,7 +62,7 @@ def is_valid_frame_name(s: str) -> bool:
     """
     if not s:
         return False
-    return bool(FRAME_NAME.match(s))
+    return bool(FRAME_NAME.fullmatch(s))
 
 
 def is_valid_semver(s: str) -> bool:
@@ -68,6 +71,10 @@ def is_valid_semver(s: str) -> bool:
     Pre-release and build metadata are NOT allowed per spec.
     Examples: 1.0.0, 0.1.0, 2.1.3
     """
-    if not s:
+    # Fixed shape, so split and check digits directly rather than run a regex.
+    # isascii() keeps non-ASCII decimals (e.g. Arabic-Indic) out.
+    parts = s.split(".")
+    if len(parts) != 3 or not s.isascii():
         return False
-    return bool(SEMVER.match(s))
+    major, minor, patch = parts
+    return major.isdecimal() and minor.isdecimal() and patch.isdecimal()
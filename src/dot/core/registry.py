@@ -5,6 +5,11 @@ T027-T029: Implement key set derivation, concept registry, hook registry
 Spec Reference: data-model.md §Auto-Derived Registries
 """
 
+import functools
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
 from dot.models.frame import Hook
 from dot.models.manifest import Manifest
 
@@ -20,42 +25,42 @@ def _build_key_set(hook: Hook) -> str:
         - ORDER@SAP~AU
         - ORDER~BILLING@SAP~EU
     """
+    return _format_key_set(hook.concept, hook.qualifier, hook.source, hook.tenant)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_key_set(concept: str, qualifier: str | None, source: str, tenant: str | None) -> str:
+    """Format a key set from its parts.
+
+    Memoized: the same hook (e.g. a foreign _hk__customer) recurs across frames.
+    """
     # Build concept part
-    concept_part = hook.concept.upper()
-    if hook.qualifier:
-        concept_part += f"~{hook.qualifier.upper()}"
+    concept_part = concept.upper()
+    if qualifier:
+        concept_part += f"~{qualifier.upper()}"
 
     # Build source part
-    source_part = hook.source.upper()
-    if hook.tenant:
-        source_part += f"~{hook.tenant.upper()}"
+    source_part = source.upper()
+    if tenant:
+        source_part += f"~{tenant.upper()}"
 
     return f"{concept_part}@{source_part}"
 
 
-def derive_key_sets(manifest: Manifest) -> set[str]:
+def derive_key_sets(manifest: Manifest) -> frozenset[str]:
     """Derive unique key sets from all hooks in manifest.
 
-    Returns a set of unique key set strings.
+    Returns a frozenset of unique key set strings.
     """
-    key_sets: set[str] = set()
-    for frame in manifest.frames:
-        for hook in frame.hooks:
-            key_set = _build_key_set(hook)
-            key_sets.add(key_set)
-    return key_sets
+    return frozenset(_build_key_set(hook) for frame in manifest.frames for hook in frame.hooks)
 
 
-def derive_concepts(manifest: Manifest) -> set[str]:
+def derive_concepts(manifest: Manifest) -> frozenset[str]:
     """Derive unique concept names from all hooks in manifest.
 
-    Returns a set of unique concept names (lowercase).
+    Returns a frozenset of unique concept names (lowercase).
     """
-    concepts: set[str] = set()
-    for frame in manifest.frames:
-        for hook in frame.hooks:
-            concepts.add(hook.concept)
-    return concepts
+    return frozenset(hook.concept for frame in manifest.frames for hook in frame.hooks)
 
 
 def derive_hook_registry(manifest: Manifest) -> dict[str, list[tuple[str, Hook]]]:
@@ -68,8 +73,52 @@ def derive_hook_registry(manifest: Manifest) -> dict[str, list[tuple[str, Hook]]
     """
     registry: dict[str, list[tuple[str, Hook]]] = {}
     for frame in manifest.frames:
+        frame_name = frame.name
         for hook in frame.hooks:
-            if hook.name not in registry:
-                registry[hook.name] = []
-            registry[hook.name].append((frame.name, hook))
+            # One lookup per hook; setdefault(name, []) would build a
+            # throwaway list for every repeated name
+            entries = registry.get(hook.name)
+            if entries is None:
+                registry[hook.name] = [(frame_name, hook)]
+            else:
+                entries.append((frame_name, hook))
     return registry
+
+
+@dataclass(frozen=True)
+class RegistryBundle:
+    """All auto-derived registries of a manifest (see derive_registries).
+
+    Every field is read-only: hooks is a mapping proxy over tuples. The
+    bundle is still not hashable, since mapping proxies are not.
+    """
+
+    key_sets: frozenset[str]
+    concepts: frozenset[str]
+    hooks: Mapping[str, tuple[tuple[str, Hook], ...]]
+
+
+def derive_registries(manifest: Manifest) -> RegistryBundle:
+    """Derive key sets, concepts and the hook registry in one pass.
+
+    Same results as derive_key_sets, derive_concepts and derive_hook_registry,
+    for callers that need more than one of them.
+    """
+    key_sets: set[str] = set()
+    concepts: set[str] = set()
+    hooks: dict[str, list[tuple[str, Hook]]] = {}
+    for frame in manifest.frames:
+        frame_name = frame.name
+        for hook in frame.hooks:
+            key_sets.add(_build_key_set(hook))
+            concepts.add(hook.concept)
+            entries = hooks.get(hook.name)
+            if entries is None:
+                hooks[hook.name] = [(frame_name, hook)]
+            else:
+                entries.append((frame_name, hook))
+    return RegistryBundle(
+        key_sets=frozenset(key_sets),
+        concepts=frozenset(concepts),
+        hooks=MappingProxyType({name: tuple(entries) for name, entries in hooks.items()}),
+    )
@@ -5,6 +5,8 @@ T031-T036: Implement all ERROR and WARN validation rules
 Spec Reference: spec.md#validation-rules, data-model.md §Validation Rules Reference
 """
 
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
 from typing import Any
 
 from dot.core.expression import validate_expr
@@ -379,12 +381,22 @@ def validate_hook_name_uniqueness(frame: Frame, path: str) -> list[Diagnostic]:
 # =============================================================================
 
 
-def validate_concept_in_frames(concept: Concept, path: str, manifest: Manifest) -> list[Diagnostic]:
-    """CONCEPT-001: Concept must be used in at least one hook."""
+def validate_concept_in_frames(
+    concept: Concept,
+    path: str,
+    manifest: Manifest,
+    used_concepts: AbstractSet[str] | None = None,
+) -> list[Diagnostic]:
+    """CONCEPT-001: Concept must be used in at least one hook.
+
+    Callers checking many concepts can pass used_concepts (from
+    derive_concepts) so the hooks are scanned once rather than per concept.
+    """
     diagnostics: list[Diagnostic] = []
 
     # Get all concepts used in hooks
-    used_concepts = derive_concepts(manifest)
+    if used_concepts is None:
+        used_concepts = derive_concepts(manifest)
 
     if concept.name not in used_concepts:
         diagnostics.append(
@@ -461,17 +473,25 @@ def warn_concept_count(manifest: Manifest) -> list[Diagnostic]:
     return diagnostics
 
 
-def warn_weak_hook_mismatch(hook: Hook, path: str, concepts: list[Concept]) -> list[Diagnostic]:
-    """HOOK-W01: Warn if weak hook prefix but concept is_weak=False."""
+def warn_weak_hook_mismatch(
+    hook: Hook,
+    path: str,
+    concepts_by_name: Mapping[str, Concept],
+) -> list[Diagnostic]:
+    """HOOK-W01: Warn if weak hook prefix but concept is_weak=False.
+
+    concepts_by_name maps each concept name to its first definition in the
+    manifest, as built once by validate_manifest.
+    """
     diagnostics: list[Diagnostic] = []
 
-    # Check if hook uses weak prefix
-    uses_weak_prefix = hook.name.startswith("_wk__")
+    # Only weak hooks can mismatch, so skip the concept lookup otherwise
+    if not hook.name.startswith("_wk__"):
+        return diagnostics
 
-    # Find matching concept
-    matching_concept = next((c for c in concepts if c.name == hook.concept), None)
+    matching_concept = concepts_by_name.get(hook.concept)
 
-    if uses_weak_prefix and matching_concept and not matching_concept.is_weak:
+    if matching_concept and not matching_concept.is_weak:
         diagnostics.append(
             Diagnostic(
                 rule_id="HOOK-W01",
@@ -38,6 +38,7 @@ from dot.core.rules import (
     warn_unknown_fields,
     warn_weak_hook_mismatch,
 )
+from dot.models.concept import Concept
 from dot.models.diagnostic import Diagnostic, Severity
 from dot.models.manifest import Manifest
 
@@ -63,6 +64,13 @@ def validate_manifest(
     diagnostics: list[Diagnostic] = []
     settings = manifest.settings
 
+    # Lookups shared by per-hook and per-concept rules, built once
+    concepts_by_name: dict[str, Concept] = {}
+    for concept in manifest.concepts:
+        concepts_by_name.setdefault(concept.name, concept)
+    # Filled during the hook walk below (same result as derive_concepts)
+    used_concepts: set[str] = set()
+
     # ==========================================================================
     # MANIFEST-level rules
     # ==========================================================================
@@ -86,6 +94,7 @@ def validate_manifest(
         # HOOK-level rules within frame
         for j, hook in enumerate(frame.hooks):
             hook_path = f"{path}.hooks[{j}]"
+            used_concepts.add(hook.concept)
 
             diagnostics.extend(validate_hook_required_fields(hook, hook_path))
             diagnostics.extend(validate_hook_name(hook, hook_path, settings))
@@ -96,7 +105,7 @@ def validate_manifest(
 
             # WARN: weak hook mismatch
             if include_warnings:
-                diagnostics.extend(warn_weak_hook_mismatch(hook, hook_path, manifest.concepts))
+                diagnostics.extend(warn_weak_hook_mismatch(hook, hook_path, concepts_by_name))
 
         # WARN: too many hooks
         if include_warnings:
@@ -110,7 +119,7 @@ def validate_manifest(
     for i, concept in enumerate(manifest.concepts):
         path = f"concepts[{i}]"
 
-        diagnostics.extend(validate_concept_in_frames(concept, path, manifest))
+        diagnostics.extend(validate_concept_in_frames(concept, path, manifest, used_concepts))
         diagnostics.extend(validate_concept_description(concept, path))
 
     # ==========================================================================
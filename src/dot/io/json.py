@@ -11,10 +11,36 @@ from typing import TYPE_CHECKING, Any, overload
 
 from dot.models.manifest import Manifest
 
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
 if TYPE_CHECKING:
     from typing import Literal
 
 
+def dumps_json(data: Any, *, indent: int = 2, ensure_ascii: bool = False) -> str:
+    """Serialize data to a JSON string, using orjson when available.
+
+    orjson only supports two-space indentation and never escapes non-ASCII
+    characters, so other indents and ensure_ascii=True fall back to the
+    standard library encoder. Key order is preserved either way.
+
+    Args:
+        data: JSON-serializable data.
+        indent: Indentation level for pretty-printing (default 2).
+        ensure_ascii: Escape non-ASCII characters as \\uXXXX (default False).
+
+    Returns:
+        JSON string without a trailing newline.
+    """
+    if orjson is not None and indent == 2 and not ensure_ascii:
+        encoded: bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return encoded.decode("utf-8")
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii)
+
+
 def parse_json(path: Path) -> dict[str, Any]:
     """Parse JSON file and return dictionary.
 
@@ -31,8 +57,13 @@ def parse_json(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        data: dict[str, Any] = json.load(f)
+    data: dict[str, Any]
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
 
     return data
 
@@ -103,7 +134,7 @@ def dump_manifest_json(
     # Use Pydantic's model_dump for serialization
     data = manifest.model_dump(mode="json", exclude_none=True)
 
-    json_str = json.dumps(data, indent=indent, ensure_ascii=False)
+    json_str = dumps_json(data, indent=indent)
 
     if path is None:
         return json_str
@@ -7,17 +7,36 @@ Uses ruamel.yaml for ordered key output per data-model.md
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
 from ruamel.yaml import YAML
 from ruamel.yaml.error import YAMLError
 
+from dot import __version__
 from dot.models.manifest import Manifest
+from dot.models.settings import Settings
 
 if TYPE_CHECKING:
     from typing import Literal
 
+# Opt-in persistent cache: DOT_YAML_CACHE=1 pickles loaded manifests into a
+# per-user cache directory (see _cache_dir), never next to the manifest.
+YAML_CACHE_ENV = "DOT_YAML_CACHE"
+CACHE_SUFFIX = ".pkl"
+# Buffer size for streaming dumps to disk
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Hook fields whose values repeat across a manifest (see _share_hook_strings)
+_SHARED_HOOK_KEYS = ("concept", "source", "qualifier", "tenant")
+
 
 class ParseError(Exception):
     """YAML parsing error with location information."""
@@ -73,18 +92,14 @@ def _create_yaml() -> YAML:
     return yaml
 
 
-def _convert_ordered_dict_to_dict(data: Any) -> Any:
-    """Recursively convert OrderedDict to regular dict for serialization.
+def _create_loader() -> YAML:
+    """Create a safe YAML instance for parsing.
 
-    This ensures ruamel.yaml outputs regular mappings without !!omap tags.
+    The safe loader builds plain dicts/lists instead of round-trip
+    CommentedMap nodes, and uses the libyaml-backed C parser when
+    ruamel.yaml.clib is installed (pure Python otherwise).
     """
-    from collections import OrderedDict
-
-    if isinstance(data, dict | OrderedDict):
-        return {k: _convert_ordered_dict_to_dict(v) for k, v in data.items()}
-    elif isinstance(data, list | tuple):
-        return [_convert_ordered_dict_to_dict(item) for item in data]
-    return data
+    return YAML(typ="safe")
 
 
 def parse_yaml(path: Path) -> dict[str, Any]:
@@ -103,11 +118,27 @@ def parse_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    yaml = _create_yaml()
+    return _parse_yaml_str(path.read_bytes().decode("utf-8"), path)
+
+
+def _parse_yaml_str(text: str, source: Path | str) -> dict[str, Any]:
+    """Parse YAML text and return dictionary.
+
+    Args:
+        text: YAML document.
+        source: File path or label reported in ParseError.
+
+    Returns:
+        Parsed dictionary with preserved key order.
+
+    Raises:
+        ParseError: If YAML syntax is invalid, or the document is empty or
+            not a mapping.
+    """
+    yaml = _create_loader()
 
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.load(f)
+        data = yaml.load(text)
     except YAMLError as e:
         # Extract line/column from ruamel.yaml error
         line = None
@@ -117,7 +148,7 @@ def parse_yaml(path: Path) -> dict[str, Any]:
             column = e.problem_mark.column + 1
         raise ParseError(
             message=str(e),
-            file_path=path,
+            file_path=source,
             line=line,
             column=column,
         ) from e
@@ -125,12 +156,20 @@ def parse_yaml(path: Path) -> dict[str, Any]:
     if data is None:
         raise ParseError(
             message="Empty YAML file",
-            file_path=path,
+            file_path=source,
             line=1,
             column=1,
         )
 
-    return dict(data)
+    if not isinstance(data, dict):
+        raise ParseError(
+            message=f"Expected a mapping at the top level, got {type(data).__name__}",
+            file_path=source,
+            line=1,
+            column=1,
+        )
+
+    return data
 
 
 @overload
@@ -172,14 +211,153 @@ def load_manifest_yaml(
         ParseError: If YAML syntax is invalid.
         pydantic.ValidationError: If data does not match schema.
     """
-    raw_data = parse_yaml(path)
-    manifest = Manifest.model_validate(raw_data)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+
+    manifest, raw_data = _load_manifest_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
     if return_raw:
-        return manifest, raw_data
+        # Deep copy so callers cannot mutate the cached frames/hooks/metadata
+        return manifest, copy.deepcopy(raw_data)
     return manifest
 
 
+@functools.lru_cache(maxsize=128)
+def _load_manifest_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[Manifest, dict[str, Any]]:
+    """Parse and validate a manifest file, memoized on its stat signature.
+
+    The (mtime_ns, size) pair is part of the key so edited files are re-read.
+    Manifest is frozen and holds its collections as tuples, so sharing cached
+    instances between callers is safe.
+    """
+    source = Path(path)
+    if os.environ.get(YAML_CACHE_ENV) != "1":
+        raw_data = _share_hook_strings(parse_yaml(source))
+        return Manifest.model_validate(raw_data), raw_data
+
+    content = source.read_bytes()
+    key = _sidecar_key(content)
+    cached = _read_sidecar(source, key)
+    if cached is not None:
+        return cached
+
+    raw_data = _share_hook_strings(_parse_yaml_str(content.decode("utf-8"), source))
+    result = (Manifest.model_validate(raw_data), raw_data)
+    _write_sidecar(source, key, result)
+    return result
+
+
+def _share_hook_strings(data: dict[str, Any]) -> dict[str, Any]:
+    """Make equal hook concept/source/qualifier/tenant values one object.
+
+    The parser allocates a new str per scalar, so a source system named on
+    every hook is stored once per hook. Pydantic keeps str inputs as-is, so
+    collapsing duplicates here carries through to the models. Uses a
+    per-load dict rather than sys.intern to keep nothing alive afterwards.
+    """
+    shared: dict[str, str] = {}
+    frames = data.get("frames")
+    if not isinstance(frames, list):
+        return data
+    for frame in frames:
+        hooks = frame.get("hooks") if isinstance(frame, dict) else None
+        if not isinstance(hooks, list):
+            continue
+        for hook in hooks:
+            if not isinstance(hook, dict):
+                continue
+            for key in _SHARED_HOOK_KEYS:
+                value = hook.get(key)
+                if isinstance(value, str):
+                    hook[key] = shared.setdefault(value, value)
+    return data
+
+
+def _cache_dir() -> Path:
+    """Return the per-user directory holding pickle sidecars.
+
+    Uses $XDG_CACHE_HOME, %LOCALAPPDATA% on Windows, or ~/.cache.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base and os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "dot-organize" / "manifests"
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the cache file for a resolved YAML path, named by a hash of the path."""
+    digest = hashlib.sha256(str(path).encode("utf-8")).hexdigest()
+    return _cache_dir() / f"{digest}{CACHE_SUFFIX}"
+
+
+@functools.cache
+def _schema_fingerprint() -> str:
+    """Return a hash of the Manifest JSON schema.
+
+    Dev installs all report the same fallback __version__, so the schema is
+    part of the sidecar key to keep model changes from loading stale pickles.
+    """
+    schema = json.dumps(Manifest.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+def _sidecar_key(content: bytes) -> tuple[str, str, str]:
+    """Return the (dot version, schema hash, content hash) a sidecar must match."""
+    return __version__, _schema_fingerprint(), hashlib.sha256(content).hexdigest()
+
+
+def _read_sidecar(path: Path, key: tuple[str, str, str]) -> tuple[Manifest, dict[str, Any]] | None:
+    """Load a cached (Manifest, raw_data) pair if it was stored under key.
+
+    The key ties the sidecar to the exact file content, dot version and model
+    schema, so edits within one mtime tick and sidecars from older releases
+    are misses.
+    """
+    sidecar = _sidecar_path(path)
+    try:
+        cached = pickle.loads(sidecar.read_bytes())
+    except Exception:
+        # Truncated or foreign pickles can raise almost anything; the cache
+        # is opt-in and must never break a load
+        return None
+
+    if not (
+        isinstance(cached, tuple)
+        and len(cached) == 3
+        and cached[0] == key
+        and isinstance(cached[1], Manifest)
+        and isinstance(cached[2], dict)
+    ):
+        return None
+    return cached[1], cached[2]
+
+
+def _write_sidecar(
+    path: Path, key: tuple[str, str, str], result: tuple[Manifest, dict[str, Any]]
+) -> None:
+    """Atomically write the pickle sidecar; failures only cost the cache."""
+    sidecar = _sidecar_path(path)
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, prefix=f".{sidecar.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, *result), f, protocol=5)
+            os.replace(tmp_name, sidecar)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        pass
+
+
 def dump_manifest_yaml(manifest: Manifest, path: Path | None = None) -> str | None:
     """Serialize manifest to YAML.
 
@@ -192,9 +370,8 @@ def dump_manifest_yaml(manifest: Manifest, path: Path | None = None) -> str | No
     """
     yaml = _create_yaml()
 
-    # Convert to dict with proper key order, then to regular dicts to avoid !!omap
-    ordered_data = _manifest_to_ordered_dict(manifest)
-    data = _convert_ordered_dict_to_dict(ordered_data)
+    # Plain dicts keep insertion order, so no !!omap tags are emitted
+    data = _manifest_to_ordered_dict(manifest)
 
     if path is None:
         from io import StringIO
@@ -203,7 +380,8 @@ def dump_manifest_yaml(manifest: Manifest, path: Path | None = None) -> str | No
         yaml.dump(data, stream)
         return stream.getvalue()
 
-    with path.open("w", encoding="utf-8") as f:
+    # The emitter streams many small writes; a 1 MiB buffer batches them
+    with path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
         yaml.dump(data, f)
     return None
 
@@ -213,9 +391,7 @@ def _manifest_to_ordered_dict(manifest: Manifest) -> dict[str, Any]:
 
     Key order follows data-model.md specification.
     """
-    from collections import OrderedDict
-
-    result: dict[str, Any] = OrderedDict()
+    result: dict[str, Any] = {}
 
     # Top-level fields in order
     result["manifest_version"] = manifest.manifest_version
@@ -261,8 +437,6 @@ def _metadata_to_dict(metadata: Any) -> dict[str, Any]:
 
 def _settings_to_dict(settings: Any) -> dict[str, Any]:
     """Convert Settings to dict (only non-default values)."""
-    from dot.models.settings import Settings
-
     defaults = Settings()
     result: dict[str, Any] = {}
 
@@ -79,10 +79,10 @@ class Frame(BaseModel, frozen=True):
         name: Frame name (e.g., "frame.customer")
         source: Source specification (relation OR path)
         description: Optional description
-        hooks: List of hooks (at least one required)
+        hooks: Tuple of hooks (at least one required)
     """
 
     name: str
     source: Source
     description: str | None = None
-    hooks: list[Hook]
+    hooks: tuple[Hook, ...]
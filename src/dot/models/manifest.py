@@ -21,7 +21,7 @@ class Metadata(BaseModel, frozen=True):
         description: Optional description
         owner: Optional owner contact
         version: Optional version string
-        tags: Optional list of tags
+        tags: Optional tuple of tags
         created_at: ISO 8601 timestamp (optional)
         updated_at: ISO 8601 timestamp (optional)
     """
@@ -30,7 +30,7 @@ class Metadata(BaseModel, frozen=True):
     description: str | None = None
     owner: str | None = None
     version: str | None = None
-    tags: list[str] = Field(default_factory=list)
+    tags: tuple[str, ...] = ()
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -43,7 +43,7 @@ class Manifest(BaseModel, frozen=True):
         schema_version: Manifest schema version (semver)
         metadata: Name, description, timestamps (optional)
         settings: Hook prefixes, delimiter (uses defaults if not specified)
-        frames: List of frames (at least one)
+        frames: Tuple of frames (at least one)
         concepts: Auto-populated concepts with frame references (FR-037)
         keysets: Auto-populated key sets with frame references (FR-039)
     """
@@ -52,6 +52,6 @@ class Manifest(BaseModel, frozen=True):
     schema_version: str
     metadata: Metadata | None = None
     settings: Settings = Field(default_factory=Settings)
-    frames: list[Frame]
-    concepts: list[Concept] = Field(default_factory=list)
-    keysets: list[KeySet] = Field(default_factory=list)
+    frames: tuple[Frame, ...]
+    concepts: tuple[Concept, ...] = ()
+    keysets: tuple[KeySet, ...] = ()
@@ -0,0 +1,55 @@
+"""Shared pytest fixtures for integration tests."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports() -> None:
+    """Import the CLI and I/O modules and exercise model validation once.
+
+    Moves the one-off cost of building the CLI and running Pydantic
+    validation for the first time out of whichever test happens to run first.
+    """
+    from dot.cli.main import app  # noqa: F401
+    from dot.io import json as _json  # noqa: F401
+    from dot.io import yaml as _yaml  # noqa: F401
+    from dot.models.manifest import Manifest
+
+    Manifest.model_validate(
+        {
+            "manifest_version": "1.0.0",
+            "schema_version": "1.0.0",
+            "frames": [
+                {
+                    "name": "frame.customer",
+                    "source": {"relation": "psa.customer"},
+                    "hooks": [
+                        {
+                            "name": "_hk__customer",
+                            "role": "primary",
+                            "concept": "customer",
+                            "source": "CRM",
+                            "expr": "customer_id",
+                        }
+                    ],
+                }
+            ],
+            "concepts": [],
+        }
+    )
+
+
+@pytest.fixture
+def temp_cwd(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Change to a fresh directory under the session temp base."""
+    cwd = tmp_path_factory.mktemp("cwd", numbered=True)
+    monkeypatch.chdir(cwd)
+    return cwd
+
+
+@pytest.fixture(scope="session")
+def bad_yaml_bytes() -> bytes:
+    """Return a YAML document with a syntax error."""
+    return b"invalid: yaml: :\n  - broken"
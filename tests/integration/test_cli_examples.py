@@ -12,7 +12,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pytest
 import yaml
 from typer.testing import CliRunner
 
@@ -21,18 +20,6 @@ from dot.cli.main import app
 runner = CliRunner()
 
 
-# =============================================================================
-# Fixtures
-# =============================================================================
-
-
-@pytest.fixture
-def temp_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Change to a temporary directory for file operations."""
-    monkeypatch.chdir(tmp_path)
-    return tmp_path
-
-
 # =============================================================================
 # Test: Examples List
 # =============================================================================
@@ -17,25 +17,21 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
-import pytest
-import yaml
-from typer.testing import CliRunner
+from click.testing import CliRunner
+from typer.main import get_command
 
 from dot.cli.main import app
+from dot.cli.validate import validate_file
+from dot.core.validation import has_errors
+from dot.io.yaml import load_manifest_yaml
+from dot.models.frame import HookRole
 
-runner = CliRunner()
-
-
-# =============================================================================
-# Fixtures
-# =============================================================================
-
+# Build the Click command tree once; typer's CliRunner rebuilds it on every invoke
+_CLICK_APP = get_command(app)
 
-@pytest.fixture
-def temp_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Change to a temporary directory for file operations."""
-    monkeypatch.chdir(tmp_path)
-    return tmp_path
+# Click >= 8.2 always captures stdout and stderr separately; assertions on
+# command output read result.stdout so stderr noise is not scanned.
+runner = CliRunner()
 
 
 # =============================================================================
@@ -151,7 +147,7 @@ class TestWizardCompleteFlow:
         )
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input=input_text,
         )
@@ -182,7 +178,7 @@ class TestWizardCompleteFlow:
         input_text = make_wizard_input()
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init", "--format", "json"],
             input=input_text,
         )
@@ -194,7 +190,7 @@ class TestWizardCompleteFlow:
         assert manifest_path.exists(), "JSON manifest not created"
 
         # Validate JSON content
-        content = json.loads(manifest_path.read_text())
+        content = json.loads(manifest_path.read_bytes())
         assert "manifest_version" in content or "schema_version" in content
         assert "frames" in content
 
@@ -203,26 +199,26 @@ class TestWizardCompleteFlow:
         input_text = make_wizard_input()
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input=input_text,
         )
 
         assert result.exit_code == 0, f"Failed: {result.output}"
         # Summary should be shown before confirmation
-        assert "frame.customers" in result.output or "customers" in result.output
+        assert "frame.customers" in result.stdout or "customers" in result.stdout
 
     def test_wizard_validates_output_file(self, temp_cwd: Path) -> None:
         """Created manifest passes validation."""
         input_text = make_wizard_input()
 
         # Run wizard
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Wizard failed: {result.output}"
 
-        # Validate the created manifest
-        result = runner.invoke(app, ["validate", "manifest.yaml"])
-        assert result.exit_code == 0, f"Validation failed: {result.output}"
+        # Validate the created manifest (CLI wiring is covered in test_cli_validate)
+        diagnostics = validate_file(temp_cwd / "manifest.yaml")
+        assert not has_errors(diagnostics), f"Validation failed: {diagnostics}"
 
 
 # =============================================================================
@@ -254,7 +250,7 @@ class TestWizardInputValidation:
         ]
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines) + "\n",
         )
@@ -284,7 +280,7 @@ class TestWizardInputValidation:
         ]
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines) + "\n",
         )
@@ -325,13 +321,14 @@ class TestWizardOverwrite:
         ]
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines) + "\n",
         )
 
         # Should ask about overwrite
-        assert "overwrite" in result.output.lower() or "exist" in result.output.lower()
+        stdout = result.stdout.lower()
+        assert "overwrite" in stdout or "exist" in stdout
 
     def test_can_decline_overwrite(self, temp_cwd: Path) -> None:
         """Declining overwrite preserves original file."""
@@ -358,7 +355,7 @@ class TestWizardOverwrite:
         ]
 
         _result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines) + "\n",
         )
@@ -394,15 +391,16 @@ class TestWizardCtrlC:
             mock_save.return_value = True
 
             # Simulate the wizard being interrupted
-            _result = runner.invoke(
-                app,
+            result = runner.invoke(
+                _CLICK_APP,
                 ["init"],
                 input="\n".join(input_lines) + "\n",
                 catch_exceptions=False,
             )
 
             # The wizard should handle partial input gracefully
-            # Either by completing or by noting the interruption
+            # Either by completing or by aborting cleanly
+            assert result.exit_code in (0, 1), result.output
 
     def test_ctrlc_without_frame_no_draft(self, temp_cwd: Path) -> None:
         """Ctrl+C before completing a frame does not save draft."""
@@ -413,7 +411,7 @@ class TestWizardCtrlC:
         ]
 
         _result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines),  # No trailing newline = incomplete
         )
@@ -440,13 +438,13 @@ class TestNonTTYDetection:
 
             # The init command should detect non-TTY and error
             result = runner.invoke(
-                app,
+                _CLICK_APP,
                 ["init", "--check-tty"],  # Flag to force TTY check
                 input="",
             )
 
             # Should exit with code 2 (usage error)
-            if "--check-tty" in result.output or result.exit_code == 2:
+            if "--check-tty" in result.stderr or result.exit_code == 2:
                 # Expected behavior - error about non-interactive mode
                 pass
             # Alternatively, CliRunner might simulate TTY
@@ -467,7 +465,7 @@ class TestCustomOutput:
         input_text = make_wizard_input()
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init", "--output", str(custom_path)],
             input=input_text,
         )
@@ -482,7 +480,7 @@ class TestCustomOutput:
         input_text = make_wizard_input()
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init", "--output", str(json_path)],
             input=input_text,
         )
@@ -491,7 +489,7 @@ class TestCustomOutput:
         assert json_path.exists()
 
         # Verify it's valid JSON
-        content = json.loads(json_path.read_text())
+        content = json.loads(json_path.read_bytes())
         assert "frames" in content
 
 
@@ -536,7 +534,7 @@ class TestMultipleFrames:
         ]
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines) + "\n",
         )
@@ -544,8 +542,8 @@ class TestMultipleFrames:
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
-        assert len(content["frames"]) == 2
+        manifest = load_manifest_yaml(manifest_path)
+        assert len(manifest.frames) == 2
 
     def test_composite_grain_multiple_primary_hooks(self, temp_cwd: Path) -> None:
         """Wizard supports composite grain with multiple primary hooks."""
@@ -573,7 +571,7 @@ class TestMultipleFrames:
         ]
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines) + "\n",
         )
@@ -581,9 +579,9 @@ class TestMultipleFrames:
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
-        hooks = content["frames"][0]["hooks"]
-        primary_hooks = [h for h in hooks if h.get("role") == "primary"]
+        manifest = load_manifest_yaml(manifest_path)
+        hooks = manifest.frames[0].hooks
+        primary_hooks = [h for h in hooks if h.role == HookRole.PRIMARY]
         assert len(primary_hooks) == 2
 
 
@@ -614,7 +612,7 @@ class TestFileBasedSource:
         ]
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input="\n".join(input_lines) + "\n",
         )
@@ -622,8 +620,8 @@ class TestFileBasedSource:
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
-        assert content["frames"][0]["source"]["path"] == "/data/customers.csv"
+        manifest = load_manifest_yaml(manifest_path)
+        assert manifest.frames[0].source.path == "/data/customers.csv"
 
 
 # =============================================================================
@@ -648,7 +646,7 @@ class TestForeignHooks:
         )
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input=input_text,
         )
@@ -656,15 +654,15 @@ class TestForeignHooks:
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
-        hooks = content["frames"][0]["hooks"]
+        manifest = load_manifest_yaml(manifest_path)
+        hooks = manifest.frames[0].hooks
 
         # Should have 1 primary + 1 foreign hook
-        primary_hooks = [h for h in hooks if h.get("role") == "primary"]
-        foreign_hooks = [h for h in hooks if h.get("role") == "foreign"]
+        primary_hooks = [h for h in hooks if h.role == HookRole.PRIMARY]
+        foreign_hooks = [h for h in hooks if h.role == HookRole.FOREIGN]
         assert len(primary_hooks) == 1
         assert len(foreign_hooks) == 1
-        assert foreign_hooks[0]["concept"] == "customer"
+        assert foreign_hooks[0].concept == "customer"
 
     def test_wizard_with_multiple_foreign_hooks(self, temp_cwd: Path) -> None:
         """Wizard supports multiple foreign hooks."""
@@ -681,7 +679,7 @@ class TestForeignHooks:
         )
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input=input_text,
         )
@@ -689,13 +687,13 @@ class TestForeignHooks:
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
-        hooks = content["frames"][0]["hooks"]
+        manifest = load_manifest_yaml(manifest_path)
+        hooks = manifest.frames[0].hooks
 
-        foreign_hooks = [h for h in hooks if h.get("role") == "foreign"]
+        foreign_hooks = [h for h in hooks if h.role == HookRole.FOREIGN]
         assert len(foreign_hooks) == 2
-        assert foreign_hooks[0]["concept"] == "order"
-        assert foreign_hooks[1]["concept"] == "product"
+        assert foreign_hooks[0].concept == "order"
+        assert foreign_hooks[1].concept == "product"
 
     def test_wizard_foreign_hooks_use_same_source(self, temp_cwd: Path) -> None:
         """Foreign hooks inherit the same source system as primary hooks."""
@@ -711,7 +709,7 @@ class TestForeignHooks:
         )
 
         result = runner.invoke(
-            app,
+            _CLICK_APP,
             ["init"],
             input=input_text,
         )
@@ -719,12 +717,12 @@ class TestForeignHooks:
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
-        hooks = content["frames"][0]["hooks"]
+        manifest = load_manifest_yaml(manifest_path)
+        hooks = manifest.frames[0].hooks
 
         # Both hooks should have the same source
         for hook in hooks:
-            assert hook["source"] == "SAP"
+            assert hook.source == "SAP"
 
 
 # =============================================================================
@@ -745,15 +743,14 @@ class TestConceptsAutoPopulation:
             expr="customer_id",
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
-        assert "concepts" in content
-        assert len(content["concepts"]) == 1
-        assert content["concepts"][0]["name"] == "customer"
+        assert len(manifest.concepts) == 1
+        assert manifest.concepts[0].name == "customer"
 
     def test_concepts_include_frame_references(self, temp_cwd: Path) -> None:
         """Each concept includes list of frames where it appears."""
@@ -765,13 +762,13 @@ class TestConceptsAutoPopulation:
             expr="customer_id",
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
-        assert content["concepts"][0]["frames"] == ["frame.customers"]
+        assert manifest.concepts[0].frames == ("frame.customers",)
 
     def test_concepts_have_empty_or_no_description(self, temp_cwd: Path) -> None:
         """Auto-populated concepts have empty/missing description for user enrichment."""
@@ -783,14 +780,14 @@ class TestConceptsAutoPopulation:
             expr="customer_id",
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
         # Description should be empty or not present (excluded from serialization)
-        assert content["concepts"][0].get("description", "") == ""
+        assert manifest.concepts[0].description == ""
 
     def test_concepts_deduplicated_across_frames(self, temp_cwd: Path) -> None:
         """Same concept in multiple frames appears once with all frame references."""
@@ -823,16 +820,16 @@ class TestConceptsAutoPopulation:
             ]
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
         # Customer should appear in both frames
-        customer_concept = next((c for c in content["concepts"] if c["name"] == "customer"), None)
+        customer_concept = next((c for c in manifest.concepts if c.name == "customer"), None)
         assert customer_concept is not None
-        assert set(customer_concept["frames"]) == {"frame.orders", "frame.customers"}
+        assert set(customer_concept.frames) == {"frame.orders", "frame.customers"}
 
 
 class TestKeySetsAutoPopulation:
@@ -848,16 +845,15 @@ class TestKeySetsAutoPopulation:
             expr="customer_id",
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
-        assert "keysets" in content
-        assert len(content["keysets"]) == 1
-        assert content["keysets"][0]["name"] == "CUSTOMER@CRM"
-        assert content["keysets"][0]["concept"] == "customer"
+        assert len(manifest.keysets) == 1
+        assert manifest.keysets[0].name == "CUSTOMER@CRM"
+        assert manifest.keysets[0].concept == "customer"
 
     def test_keysets_include_frame_references(self, temp_cwd: Path) -> None:
         """Each keyset includes list of frames where it's derived."""
@@ -869,13 +865,13 @@ class TestKeySetsAutoPopulation:
             expr="customer_id",
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
-        assert content["keysets"][0]["frames"] == ["frame.customers"]
+        assert manifest.keysets[0].frames == ("frame.customers",)
 
     def test_keyset_name_includes_qualifier(self, temp_cwd: Path) -> None:
         """Keyset name includes qualifier when present: CONCEPT~QUALIFIER@SOURCE."""
@@ -888,13 +884,13 @@ class TestKeySetsAutoPopulation:
             expr="billing_customer_id",
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
-        assert content["keysets"][0]["name"] == "CUSTOMER~BILLING@CRM"
+        assert manifest.keysets[0].name == "CUSTOMER~BILLING@CRM"
 
     def test_keyset_name_includes_tenant(self, temp_cwd: Path) -> None:
         """Keyset name includes tenant when present: CONCEPT@SOURCE~TENANT."""
@@ -907,13 +903,13 @@ class TestKeySetsAutoPopulation:
             expr="customer_id",
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
-        assert content["keysets"][0]["name"] == "CUSTOMER@SAP~US"
+        assert manifest.keysets[0].name == "CUSTOMER@SAP~US"
 
     def test_multiple_keysets_from_different_sources(self, temp_cwd: Path) -> None:
         """Multiple keysets created when same concept comes from different sources."""
@@ -929,12 +925,12 @@ class TestKeySetsAutoPopulation:
             ],
         )
 
-        result = runner.invoke(app, ["init"], input=input_text)
+        result = runner.invoke(_CLICK_APP, ["init"], input=input_text)
         assert result.exit_code == 0, f"Failed: {result.output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest = load_manifest_yaml(manifest_path)
 
-        keyset_names = [ks["name"] for ks in content["keysets"]]
+        keyset_names = [ks.name for ks in manifest.keysets]
         assert "CUSTOMER@SHOPIFY" in keyset_names
         assert "CUSTOMER@CRM" in keyset_names
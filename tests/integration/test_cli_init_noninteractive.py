@@ -10,33 +10,62 @@ Tests the non-interactive manifest creation:
 from __future__ import annotations
 
 import json
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
 from pathlib import Path
+from typing import Any
 
 import pytest
+import typer
 import yaml
 from typer.testing import CliRunner
 
+from dot.cli.init import init_command
 from dot.cli.main import app
+from dot.cli.validate import validate_file
+from dot.core.validation import has_errors
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
 
 runner = CliRunner()
 
 
+def run_init(**options: Any) -> tuple[int, str]:
+    """Call init_command in-process, returning (exit_code, combined output).
+
+    Skips Click argv parsing for tests that only care about the outcome;
+    tests exercising option parsing still go through runner.invoke.
+    """
+    kwargs: dict[str, Any] = {
+        "output": None,
+        "format_": None,
+        "from_config": None,
+        "concept": None,
+        "source": None,
+        "check_tty": False,
+        **options,
+    }
+    buffer = StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        try:
+            init_command(**kwargs)
+        except typer.Exit as e:
+            return e.exit_code, buffer.getvalue()
+    return 0, buffer.getvalue()
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def temp_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Change to a temporary directory for file operations."""
-    monkeypatch.chdir(tmp_path)
-    return tmp_path
-
-
-@pytest.fixture
-def valid_seed(temp_cwd: Path) -> Path:
-    """Create a valid seed config file."""
-    seed_path = temp_cwd / "seed.yaml"
+@pytest.fixture(scope="session")
+def valid_seed_bytes() -> bytes:
+    """Serialize a valid seed config once per session."""
     seed_content: dict[str, list[dict[str, object]]] = {
         "frames": [
             {
@@ -54,25 +83,21 @@ def valid_seed(temp_cwd: Path) -> Path:
             },
         ],
     }
-    seed_path.write_text(yaml.dump(seed_content))
-    return seed_path
+    return yaml.dump(seed_content, Dumper=SafeDumper, encoding="utf-8")
 
 
-@pytest.fixture
-def invalid_seed(temp_cwd: Path) -> Path:
-    """Create an invalid seed config file."""
-    seed_path = temp_cwd / "invalid_seed.yaml"
+@pytest.fixture(scope="session")
+def invalid_seed_bytes() -> bytes:
+    """Serialize an invalid seed config once per session."""
     seed_content: dict[str, list[object]] = {
         "frames": [],  # Empty frames = invalid
     }
-    seed_path.write_text(yaml.dump(seed_content))
-    return seed_path
+    return yaml.dump(seed_content, Dumper=SafeDumper, encoding="utf-8")
 
 
-@pytest.fixture
-def seed_missing_source(temp_cwd: Path) -> Path:
-    """Create a seed with missing source."""
-    seed_path = temp_cwd / "missing_source.yaml"
+@pytest.fixture(scope="session")
+def missing_source_seed_bytes() -> bytes:
+    """Serialize a seed with missing source once per session."""
     seed_content: dict[str, list[dict[str, object]]] = {
         "frames": [
             {
@@ -88,7 +113,30 @@ def seed_missing_source(temp_cwd: Path) -> Path:
             },
         ],
     }
-    seed_path.write_text(yaml.dump(seed_content))
+    return yaml.dump(seed_content, Dumper=SafeDumper, encoding="utf-8")
+
+
+@pytest.fixture
+def valid_seed(temp_cwd: Path, valid_seed_bytes: bytes) -> Path:
+    """Create a valid seed config file."""
+    seed_path = temp_cwd / "seed.yaml"
+    seed_path.write_bytes(valid_seed_bytes)
+    return seed_path
+
+
+@pytest.fixture
+def invalid_seed(temp_cwd: Path, invalid_seed_bytes: bytes) -> Path:
+    """Create an invalid seed config file."""
+    seed_path = temp_cwd / "invalid_seed.yaml"
+    seed_path.write_bytes(invalid_seed_bytes)
+    return seed_path
+
+
+@pytest.fixture
+def seed_missing_source(temp_cwd: Path, missing_source_seed_bytes: bytes) -> Path:
+    """Create a seed with missing source."""
+    seed_path = temp_cwd / "missing_source.yaml"
+    seed_path.write_bytes(missing_source_seed_bytes)
     return seed_path
 
 
@@ -106,19 +154,16 @@ class TestFromConfigValid:
         valid_seed: Path,
     ) -> None:
         """Valid seed config creates complete manifest."""
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", str(valid_seed)],
-        )
+        exit_code, output = run_init(from_config=valid_seed)
 
-        assert result.exit_code == 0, f"Failed: {result.output}"
+        assert exit_code == 0, f"Failed: {output}"
 
         # Check manifest was created
         manifest_path = temp_cwd / "manifest.yaml"
         assert manifest_path.exists(), "Manifest not created"
 
         # Validate content
-        content = yaml.safe_load(manifest_path.read_text())
+        content = yaml.load(manifest_path.read_bytes(), Loader=SafeLoader)
         assert "manifest_version" in content
         assert "frames" in content
         assert len(content["frames"]) == 1
@@ -129,15 +174,12 @@ class TestFromConfigValid:
         valid_seed: Path,
     ) -> None:
         """Auto-generates hook names from concept@source."""
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", str(valid_seed)],
-        )
+        exit_code, output = run_init(from_config=valid_seed, format_="json")
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
-        manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest_path = temp_cwd / "manifest.json"
+        content = json.loads(manifest_path.read_bytes())
 
         hook = content["frames"][0]["hooks"][0]
         # Hook name should be auto-generated: _hk__customer__crm
@@ -152,12 +194,9 @@ class TestFromConfigValid:
         """--output flag writes to custom path."""
         custom_path = temp_cwd / "custom" / "manifest.yaml"
 
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", str(valid_seed), "--output", str(custom_path)],
-        )
+        exit_code, output = run_init(from_config=valid_seed, output=custom_path)
 
-        assert result.exit_code == 0
+        assert exit_code == 0
         assert custom_path.exists()
 
     def test_from_config_json_format(
@@ -166,18 +205,15 @@ class TestFromConfigValid:
         valid_seed: Path,
     ) -> None:
         """--format json creates JSON output."""
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", str(valid_seed), "--format", "json"],
-        )
+        exit_code, output = run_init(from_config=valid_seed, format_="json")
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
         manifest_path = temp_cwd / "manifest.json"
         assert manifest_path.exists()
 
         # Verify valid JSON
-        content = json.loads(manifest_path.read_text())
+        content = json.loads(manifest_path.read_bytes())
         assert "frames" in content
 
 
@@ -195,13 +231,10 @@ class TestFromConfigInvalid:
         invalid_seed: Path,
     ) -> None:
         """Empty frames produces error."""
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", str(invalid_seed)],
-        )
+        exit_code, output = run_init(from_config=invalid_seed)
 
-        assert result.exit_code == 1
-        assert "error" in result.output.lower()
+        assert exit_code == 1
+        assert "error" in output.lower()
 
     def test_from_config_missing_source_error(
         self,
@@ -209,36 +242,28 @@ class TestFromConfigInvalid:
         seed_missing_source: Path,
     ) -> None:
         """Missing source produces error."""
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", str(seed_missing_source)],
-        )
+        exit_code, output = run_init(from_config=seed_missing_source)
 
-        assert result.exit_code == 1
-        assert "error" in result.output.lower() or "source" in result.output.lower()
+        assert exit_code == 1
+        assert "error" in output.lower() or "source" in output.lower()
 
     def test_from_config_nonexistent_file_error(self, temp_cwd: Path) -> None:
         """Non-existent seed file produces error."""
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", "nonexistent.yaml"],
-        )
+        exit_code, output = run_init(from_config=Path("nonexistent.yaml"))
 
-        assert result.exit_code != 0
+        assert exit_code != 0
         # Should mention file not found
-        assert "not found" in result.output.lower() or "error" in result.output.lower()
+        assert "not found" in output.lower() or "error" in output.lower()
 
-    def test_from_config_invalid_yaml_error(self, temp_cwd: Path) -> None:
+    def test_from_config_invalid_yaml_error(self, temp_cwd: Path, bad_yaml_bytes: bytes) -> None:
         """Invalid YAML syntax produces error."""
         bad_yaml = temp_cwd / "bad.yaml"
-        bad_yaml.write_text("invalid: yaml: :\n  - broken")
+        bad_yaml.write_bytes(bad_yaml_bytes)
 
-        result = runner.invoke(
-            app,
-            ["init", "--from-config", str(bad_yaml)],
-        )
+        exit_code, output = run_init(from_config=bad_yaml)
 
-        assert result.exit_code != 0
+        assert exit_code == 1
+        assert "Invalid YAML in seed file" in output
 
 
 # =============================================================================
@@ -254,17 +279,14 @@ class TestQuickInitFlags:
         temp_cwd: Path,
     ) -> None:
         """--concept and --source create minimal manifest."""
-        result = runner.invoke(
-            app,
-            ["init", "--concept", "customer", "--source", "CRM"],
-        )
+        exit_code, output = run_init(concept="customer", source="CRM")
 
-        assert result.exit_code == 0, f"Failed: {result.output}"
+        assert exit_code == 0, f"Failed: {output}"
 
         manifest_path = temp_cwd / "manifest.yaml"
         assert manifest_path.exists()
 
-        content = yaml.safe_load(manifest_path.read_text())
+        content = yaml.load(manifest_path.read_bytes(), Loader=SafeLoader)
         assert len(content["frames"]) == 1
 
         frame = content["frames"][0]
@@ -275,15 +297,12 @@ class TestQuickInitFlags:
         temp_cwd: Path,
     ) -> None:
         """Auto-derives frame name from concept."""
-        result = runner.invoke(
-            app,
-            ["init", "--concept", "order", "--source", "ERP"],
-        )
+        exit_code, output = run_init(concept="order", source="ERP", format_="json")
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
-        manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest_path = temp_cwd / "manifest.json"
+        content = json.loads(manifest_path.read_bytes())
 
         # Frame name should include concept
         frame_name = content["frames"][0]["name"]
@@ -294,15 +313,12 @@ class TestQuickInitFlags:
         temp_cwd: Path,
     ) -> None:
         """Auto-generates hook from concept and source."""
-        result = runner.invoke(
-            app,
-            ["init", "--concept", "product", "--source", "PIM"],
-        )
+        exit_code, output = run_init(concept="product", source="PIM", format_="json")
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
-        manifest_path = temp_cwd / "manifest.yaml"
-        content = yaml.safe_load(manifest_path.read_text())
+        manifest_path = temp_cwd / "manifest.json"
+        content = json.loads(manifest_path.read_bytes())
 
         hook = content["frames"][0]["hooks"][0]
         assert hook["concept"] == "product"
@@ -317,7 +333,8 @@ class TestQuickInitFlags:
         )
 
         # Should error - source is required
-        assert result.exit_code != 0 or "source" in result.output.lower()
+        assert result.exit_code == 1
+        assert "--source is required" in result.output
 
     def test_source_only_requires_concept(self, temp_cwd: Path) -> None:
         """--source alone without --concept should error."""
@@ -327,36 +344,23 @@ class TestQuickInitFlags:
         )
 
         # Should error - concept is required
-        assert result.exit_code != 0 or "concept" in result.output.lower()
+        assert result.exit_code == 1
+        assert "--concept is required" in result.output
 
     def test_quick_init_with_custom_output(self, temp_cwd: Path) -> None:
         """Quick init respects --output flag."""
         custom_path = temp_cwd / "quick.yaml"
 
-        result = runner.invoke(
-            app,
-            [
-                "init",
-                "--concept",
-                "customer",
-                "--source",
-                "CRM",
-                "--output",
-                str(custom_path),
-            ],
-        )
+        exit_code, output = run_init(concept="customer", source="CRM", output=custom_path)
 
-        assert result.exit_code == 0
+        assert exit_code == 0
         assert custom_path.exists()
 
     def test_quick_init_json_format(self, temp_cwd: Path) -> None:
         """Quick init respects --format json."""
-        result = runner.invoke(
-            app,
-            ["init", "--concept", "customer", "--source", "CRM", "--format", "json"],
-        )
+        exit_code, output = run_init(concept="customer", source="CRM", format_="json")
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
         manifest_path = temp_cwd / "manifest.json"
         assert manifest_path.exists()
@@ -384,11 +388,8 @@ class TestGeneratedManifestValidation:
         assert result.exit_code == 0
 
         # Validate
-        result = runner.invoke(
-            app,
-            ["validate", "manifest.yaml"],
-        )
-        assert result.exit_code == 0, f"Validation failed: {result.output}"
+        diagnostics = validate_file(temp_cwd / "manifest.yaml")
+        assert not has_errors(diagnostics), f"Validation failed: {diagnostics}"
 
     def test_quick_init_manifest_passes_validation(
         self,
@@ -403,8 +404,5 @@ class TestGeneratedManifestValidation:
         assert result.exit_code == 0
 
         # Validate
-        result = runner.invoke(
-            app,
-            ["validate", "manifest.yaml"],
-        )
-        assert result.exit_code == 0, f"Validation failed: {result.output}"
+        diagnostics = validate_file(temp_cwd / "manifest.yaml")
+        assert not has_errors(diagnostics), f"Validation failed: {diagnostics}"
@@ -88,10 +88,10 @@ class TestValidateCommandErrors:
         # Should contain field path like "frames[0].hooks"
         assert "." in result.stdout or "[" in result.stdout
 
-    def test_parse_error_shows_line_column(self, tmp_path: Path) -> None:
+    def test_parse_error_shows_line_column(self, tmp_path: Path, bad_yaml_bytes: bytes) -> None:
         """YAML parse error shows line and column."""
         yaml_file = tmp_path / "bad.yaml"
-        yaml_file.write_text("invalid: yaml: :")
+        yaml_file.write_bytes(bad_yaml_bytes)
 
         result = runner.invoke(app, ["validate", str(yaml_file)])
 
@@ -163,6 +163,18 @@ class TestValidateCommandJsonOutput:
         error = output["errors"][0]
         assert "rule_id" in error
 
+    def test_json_output_escapes_non_ascii(self, tmp_path: Path) -> None:
+        """JSON output is ASCII-only, with non-ASCII characters as \\u escapes."""
+        import json
+
+        manifest_path = tmp_path / "manifést.yaml"
+
+        result = runner.invoke(app, ["validate", str(manifest_path), "--json"])
+
+        assert result.stdout.isascii()
+        assert "\\u00e9" in result.stdout
+        assert json.loads(result.stdout)["error"] == f"File not found: {manifest_path}"
+
 
 class TestValidateCommandAccessibility:
     """Tests for accessibility (NFR-010)."""
@@ -181,19 +193,19 @@ class TestValidateCommandAccessibility:
         assert "\x1b[" not in result.stdout
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_manifest_path() -> Path:
     """Return path to a valid minimal manifest fixture."""
     return Path(__file__).parent.parent / "fixtures" / "valid" / "minimal.yaml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_manifest_path() -> Path:
     """Return path to an invalid manifest fixture."""
     return Path(__file__).parent.parent / "fixtures" / "invalid" / "missing_hooks.yaml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def warn_manifest_path() -> Path:
     """Return path to a manifest with warnings."""
     return Path(__file__).parent.parent / "fixtures" / "warn" / "unknown_fields.yaml"
@@ -3,16 +3,21 @@
 TDD - Write tests FIRST, must FAIL before implementation
 """
 
+import copy
 from pathlib import Path
 
+import pytest
+
+from dot.io.json import dump_manifest_json, load_manifest_json
+from dot.io.yaml import dump_manifest_yaml, load_manifest_yaml, parse_yaml
+from dot.models.manifest import Manifest
+
 
 class TestYamlRoundTrip:
     """Tests for YAML load → save → load round-trip."""
 
     def test_yaml_roundtrip_preserves_data(self, tmp_path: Path) -> None:
         """Load → save → load produces equivalent manifest."""
-        from dot.io.yaml import dump_manifest_yaml, load_manifest_yaml
-
         # Load original
         original_path = Path(__file__).parent.parent / "fixtures" / "valid" / "minimal.yaml"
         original = load_manifest_yaml(original_path)
@@ -32,8 +37,6 @@ class TestYamlRoundTrip:
 
     def test_yaml_roundtrip_preserves_key_order(self, tmp_path: Path) -> None:
         """YAML round-trip preserves key order per data-model.md."""
-        from dot.io.yaml import dump_manifest_yaml, load_manifest_yaml, parse_yaml
-
         # Load original
         original_path = Path(__file__).parent.parent / "fixtures" / "valid" / "minimal.yaml"
         original = load_manifest_yaml(original_path)
@@ -43,17 +46,34 @@ class TestYamlRoundTrip:
         dump_manifest_yaml(original, output_path)
 
         # Check key order in output
-        raw = parse_yaml(output_path)
-        keys = list(raw.keys())
+        keys = list(parse_yaml(output_path))
 
         # Expected order per data-model.md
         assert keys[0] == "manifest_version"
         assert keys[1] == "schema_version"
 
+    def test_yaml_roundtrip_does_not_deepcopy(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Load → save → load builds fresh data without copy.deepcopy."""
+
+        def _no_deepcopy(*args: object, **kwargs: object) -> None:
+            raise AssertionError("copy.deepcopy called on the round-trip path")
+
+        monkeypatch.setattr(copy, "deepcopy", _no_deepcopy)
+
+        # A fresh path misses the load_manifest_yaml cache, so parsing really runs
+        fixture = Path(__file__).parent.parent / "fixtures" / "valid" / "composite_grain.yaml"
+        original_path = tmp_path / "original.yaml"
+        original_path.write_bytes(fixture.read_bytes())
+        output_path = tmp_path / "roundtrip.yaml"
+        dump_manifest_yaml(load_manifest_yaml(original_path), output_path)
+
+        assert "!!omap" not in output_path.read_text()
+        assert load_manifest_yaml(output_path).frames
+
     def test_yaml_roundtrip_with_composite_grain(self, tmp_path: Path) -> None:
         """Round-trip works with composite grain manifest."""
-        from dot.io.yaml import dump_manifest_yaml, load_manifest_yaml
-
         original_path = Path(__file__).parent.parent / "fixtures" / "valid" / "composite_grain.yaml"
         original = load_manifest_yaml(original_path)
 
@@ -73,15 +93,12 @@ class TestJsonRoundTrip:
 
     def test_json_roundtrip_preserves_data(self, tmp_path: Path) -> None:
         """Load → save → load produces equivalent manifest."""
-        from dot.io.json import dump_manifest_json, load_manifest_json
-        from dot.models.manifest import Manifest
-
         # Create original
         original = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            frames=[],
-            concepts=[],
+            frames=(),
+            concepts=(),
         )
 
         # Save to file
@@ -100,9 +117,6 @@ class TestCrossFormatRoundTrip:
 
     def test_yaml_to_json_conversion(self, tmp_path: Path) -> None:
         """Load YAML, save as JSON, load JSON produces equivalent manifest."""
-        from dot.io.json import dump_manifest_json, load_manifest_json
-        from dot.io.yaml import load_manifest_yaml
-
         # Load from YAML
         yaml_path = Path(__file__).parent.parent / "fixtures" / "valid" / "minimal.yaml"
         original = load_manifest_yaml(yaml_path)
@@ -119,16 +133,12 @@ class TestCrossFormatRoundTrip:
 
     def test_json_to_yaml_conversion(self, tmp_path: Path) -> None:
         """Load JSON, save as YAML, load YAML produces equivalent manifest."""
-        from dot.io.json import dump_manifest_json, load_manifest_json
-        from dot.io.yaml import dump_manifest_yaml, load_manifest_yaml
-        from dot.models.manifest import Manifest
-
         # Create original
         original = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            frames=[],
-            concepts=[],
+            frames=(),
+            concepts=(),
         )
 
         # Save as JSON first
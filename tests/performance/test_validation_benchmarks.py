@@ -5,13 +5,17 @@ T108: Verify NFR-001/002/003 performance requirements:
 - NFR-002: Validation <5s for 10000 lines
 - NFR-003: Memory usage <100MB
 
-These tests use pytest-benchmark or time module for measurements.
+Timings are the median of several rounds (see median_seconds) so a single
+GC pause or scheduler hiccup does not fail a run.
 Mark as slow tests to skip in normal CI runs.
 """
 
-import resource
+import statistics
 import sys
 import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -20,9 +24,12 @@ import pytest
 
 from dot.core.validation import validate_manifest
 from dot.io.yaml import dump_manifest_yaml, load_manifest_yaml
-from dot.models.frame import Frame, Hook, HookRole, Source
-from dot.models.manifest import Manifest, Metadata
-from dot.models.settings import Settings
+from dot.models.diagnostic import Diagnostic
+from dot.models.manifest import Manifest
+
+# One timestamp for every generated manifest; an aware datetime validates
+# faster than an ISO string, which Pydantic would have to parse
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
 def generate_large_manifest(num_frames: int, hooks_per_frame: int = 5) -> Manifest:
@@ -35,38 +42,47 @@ def generate_large_manifest(num_frames: int, hooks_per_frame: int = 5) -> Manife
     Returns:
         Manifest with the specified size.
     """
-    now = datetime.now(timezone.utc)
-    frames = []
-
-    for i in range(num_frames):
-        hooks = []
-        for j in range(hooks_per_frame):
-            hook = Hook(
-                name=f"_hk__concept{i}_{j}",
-                role=HookRole.PRIMARY if j == 0 else HookRole.FOREIGN,
-                concept=f"concept{i}_{j}",
-                source=f"SRC{i % 10}",
-                expr=f"field_{j}",
-            )
-            hooks.append(hook)
-
-        frame = Frame(
-            name=f"schema{i // 100}.table{i}",
-            source=Source(relation=f"raw.source_{i}"),
-            hooks=hooks,
-        )
-        frames.append(frame)
-
-    return Manifest(
-        manifest_version="1.0.0",
-        schema_version="1.0.0",
-        metadata=Metadata(name="Large Test Manifest", created_at=now, updated_at=now),
-        settings=Settings(),
-        frames=frames,
-        concepts=[],
+    # Role and expr depend only on the hook position, and the source system
+    # cycles through ten names, so build those strings once
+    hook_slots = [
+        ("primary" if j == 0 else "foreign", f"field_{j}") for j in range(hooks_per_frame)
+    ]
+    sources = tuple(sys.intern(f"SRC{k}") for k in range(10))
+
+    # Build plain data and validate the whole tree in one call, rather than
+    # instantiating every Hook/Frame model individually
+    frames_data = [
+        {
+            "name": f"schema{i // 100}.table{i}",
+            "source": {"relation": f"raw.source_{i}"},
+            "hooks": [
+                {
+                    "name": f"_hk__concept{i}_{j}",
+                    "role": role,
+                    "concept": f"concept{i}_{j}",
+                    "source": sources[i % 10],
+                    "expr": expr,
+                }
+                for j, (role, expr) in enumerate(hook_slots)
+            ],
+        }
+        for i in range(num_frames)
+    ]
+
+    return Manifest.model_validate(
+        {
+            "manifest_version": "1.0.0",
+            "schema_version": "1.0.0",
+            "metadata": {"name": "Large Test Manifest", "created_at": _NOW, "updated_at": _NOW},
+            "frames": frames_data,
+            "concepts": [],
+        }
     )
 
 
+ManifestFactory = Callable[..., Manifest]
+
+
 def estimate_yaml_lines(num_frames: int, hooks_per_frame: int) -> int:
     """Estimate YAML line count for a manifest.
 
@@ -82,20 +98,37 @@ def estimate_yaml_lines(num_frames: int, hooks_per_frame: int) -> int:
     return 5 + (num_frames * lines_per_frame)
 
 
-def get_memory_usage_mb() -> float:
-    """Get current memory usage in MB."""
-    # Use resource module on Unix-like systems
-    if sys.platform != "win32":
-        usage = resource.getrusage(resource.RUSAGE_SELF)
-        return usage.ru_maxrss / 1024  # Convert KB to MB on Linux
-    return 0.0
+def median_seconds(
+    func: Callable[[], list[Diagnostic]], rounds: int = 5
+) -> tuple[float, list[Diagnostic]]:
+    """Run func several times; return the median wall time and the last result."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+@contextmanager
+def measure_peak() -> Iterator[Callable[[], float]]:
+    """Trace allocations inside the block; yields a getter for the peak in MB.
+
+    Unlike ru_maxrss (a process-lifetime high-water mark), this isolates the
+    wrapped operation and works on every platform.
+    """
+    tracemalloc.start()
+    try:
+        yield lambda: tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
 
 
 @pytest.mark.slow
 class TestNFR001ValidationUnder1Second:
     """NFR-001: Validation MUST complete in <1 second for manifests up to 1000 lines."""
 
-    def test_1000_lines_under_1_second(self) -> None:
+    def test_1000_lines_under_1_second(self, large_manifest_factory: ManifestFactory) -> None:
         """Validate a ~1000 line manifest in under 1 second."""
         # Calculate frames needed for ~1000 lines
         # Each frame with 5 hooks ≈ 29 lines → ~35 frames for 1000 lines
@@ -105,11 +138,11 @@ class TestNFR001ValidationUnder1Second:
 
         assert expected_lines >= 1000, f"Expected ~1000 lines, got {expected_lines}"
 
-        manifest = generate_large_manifest(num_frames, hooks_per_frame)
+        manifest = large_manifest_factory(num_frames, hooks_per_frame)
 
-        start = time.perf_counter()
-        diagnostics = validate_manifest(manifest, include_warnings=True)
-        elapsed = time.perf_counter() - start
+        elapsed, diagnostics = median_seconds(
+            lambda: validate_manifest(manifest, include_warnings=True)
+        )
 
         # Should complete in under 1 second
         assert elapsed < 1.0, f"Validation took {elapsed:.2f}s, expected <1s"
@@ -123,7 +156,7 @@ class TestNFR001ValidationUnder1Second:
 class TestNFR002ValidationUnder5Seconds:
     """NFR-002: Validation MUST complete in <5 seconds for manifests up to 10,000 lines."""
 
-    def test_10000_lines_under_5_seconds(self) -> None:
+    def test_10000_lines_under_5_seconds(self, large_manifest_factory: ManifestFactory) -> None:
         """Validate a ~10000 line manifest in under 5 seconds."""
         # Each frame with 5 hooks ≈ 29 lines → ~345 frames for 10000 lines
         num_frames = 345
@@ -132,11 +165,11 @@ class TestNFR002ValidationUnder5Seconds:
 
         assert expected_lines >= 10000, f"Expected ~10000 lines, got {expected_lines}"
 
-        manifest = generate_large_manifest(num_frames, hooks_per_frame)
+        manifest = large_manifest_factory(num_frames, hooks_per_frame)
 
-        start = time.perf_counter()
-        diagnostics = validate_manifest(manifest, include_warnings=True)
-        elapsed = time.perf_counter() - start
+        elapsed, diagnostics = median_seconds(
+            lambda: validate_manifest(manifest, include_warnings=True)
+        )
 
         # Should complete in under 5 seconds
         assert elapsed < 5.0, f"Validation took {elapsed:.2f}s, expected <5s"
@@ -150,13 +183,15 @@ class TestNFR002ValidationUnder5Seconds:
 class TestNFR003MemoryUnder100MB:
     """NFR-003: Memory usage MUST stay under 100MB for manifests up to 1MB file size."""
 
-    def test_large_manifest_memory_under_100mb(self) -> None:
+    def test_large_manifest_memory_under_100mb(
+        self, large_manifest_factory: ManifestFactory
+    ) -> None:
         """Memory usage stays under 100MB for large manifest."""
         # Generate a large manifest and write to file to measure
         num_frames = 100
         hooks_per_frame = 5
 
-        manifest = generate_large_manifest(num_frames, hooks_per_frame)
+        manifest = large_manifest_factory(num_frames, hooks_per_frame)
 
         # Write to temp file to simulate real loading
         with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
@@ -166,22 +201,13 @@ class TestNFR003MemoryUnder100MB:
         dump_manifest_yaml(manifest, temp_path)
 
         try:
-            # Get baseline memory
-            baseline_mb = get_memory_usage_mb()
+            # Load and validate, tracing only this block
+            with measure_peak() as peak:
+                loaded_manifest, raw_data = load_manifest_yaml(temp_path, return_raw=True)
+                _diagnostics = validate_manifest(loaded_manifest, raw_data=raw_data)
+                peak_mb = peak()
 
-            # Load and validate
-            loaded_manifest, raw_data = load_manifest_yaml(temp_path, return_raw=True)
-            _diagnostics = validate_manifest(loaded_manifest, raw_data=raw_data)
-
-            # Get peak memory
-            peak_mb = get_memory_usage_mb()
-            memory_increase = peak_mb - baseline_mb
-
-            # Memory increase should be reasonable (well under 100MB)
-            # Note: This is a rough check since Python GC makes exact measurement hard
-            assert memory_increase < 100, (
-                f"Memory increased by {memory_increase:.1f}MB, expected <100MB"
-            )
+            assert peak_mb < 100, f"Peak allocation was {peak_mb:.1f}MB, expected <100MB"
 
         finally:
             # Cleanup
@@ -192,26 +218,43 @@ class TestNFR003MemoryUnder100MB:
 class TestQuickValidationBenchmarks:
     """Quick benchmarks that run in normal CI."""
 
-    def test_small_manifest_under_100ms(self) -> None:
+    def test_small_manifest_under_100ms(self, large_manifest_factory: ManifestFactory) -> None:
         """Small manifest validates very quickly."""
         num_frames = 5
-        manifest = generate_large_manifest(num_frames, hooks_per_frame=3)
+        manifest = large_manifest_factory(num_frames, hooks_per_frame=3)
 
-        start = time.perf_counter()
-        _diagnostics = validate_manifest(manifest, include_warnings=True)
-        elapsed = time.perf_counter() - start
+        elapsed, _diagnostics = median_seconds(
+            lambda: validate_manifest(manifest, include_warnings=True)
+        )
 
         # Should be very fast
         assert elapsed < 0.1, f"Validation took {elapsed:.3f}s, expected <0.1s"
 
-    def test_medium_manifest_under_500ms(self) -> None:
+    def test_medium_manifest_under_500ms(self, large_manifest_factory: ManifestFactory) -> None:
         """Medium manifest (100 frames) validates quickly."""
         num_frames = 100
-        manifest = generate_large_manifest(num_frames, hooks_per_frame=5)
+        manifest = large_manifest_factory(num_frames, hooks_per_frame=5)
 
-        start = time.perf_counter()
-        _diagnostics = validate_manifest(manifest, include_warnings=True)
-        elapsed = time.perf_counter() - start
+        elapsed, _diagnostics = median_seconds(
+            lambda: validate_manifest(manifest, include_warnings=True)
+        )
 
         # Should complete quickly
         assert elapsed < 0.5, f"Validation took {elapsed:.3f}s, expected <0.5s"
+
+
+@pytest.fixture(scope="session")
+def large_manifest_factory() -> ManifestFactory:
+    """Return a generate_large_manifest wrapper memoized for the session.
+
+    Manifest is frozen, so tests asking for the same size share one instance.
+    """
+    cache: dict[tuple[int, int], Manifest] = {}
+
+    def make(num_frames: int, hooks_per_frame: int = 5) -> Manifest:
+        key = (num_frames, hooks_per_frame)
+        if key not in cache:
+            cache[key] = generate_large_manifest(num_frames, hooks_per_frame)
+        return cache[key]
+
+    return make
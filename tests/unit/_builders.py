@@ -0,0 +1,20 @@
+"""Shared model constants for unit tests.
+
+Test modules import these directly; conftest builds its fixtures on them.
+"""
+
+from datetime import datetime, timezone
+
+from dot.models.frame import Hook, HookRole
+
+# Fixed timestamp; no test depends on the current time
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Canonical primary hook, shared with module-level case tables
+CUSTOMER_HOOK = Hook(
+    name="_hk__customer",
+    role=HookRole.PRIMARY,
+    concept="customer",
+    source="CRM",
+    expr="customer_id",
+)
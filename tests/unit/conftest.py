@@ -0,0 +1,164 @@
+"""Shared model fixtures for unit tests."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from dot.models.concept import Concept
+from dot.models.diagnostic import Diagnostic, Severity
+from dot.models.frame import Frame, Hook, HookRole, Source
+from dot.models.manifest import Manifest, Metadata
+from dot.models.settings import Settings
+
+from ._builders import CUSTOMER_HOOK, NOW
+
+
+# Frozen models are safe to share, so build the canonical instances once.
+# Frame and Manifest have no validators and their parts are validated
+# already, so they skip validation via model_construct (defaults still apply).
+@pytest.fixture(scope="module")
+def sample_diagnostic() -> Diagnostic:
+    """Return an error diagnostic."""
+    return Diagnostic(
+        rule_id="HOOK-001", severity=Severity.ERROR, message="Test", path="test", fix="Fix it"
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_settings() -> Settings:
+    """Return default settings."""
+    return Settings()
+
+
+@pytest.fixture(scope="module")
+def sample_concept() -> Concept:
+    """Return a concept with only a description."""
+    return Concept(name="customer", description="Test")
+
+
+@pytest.fixture(scope="module")
+def sample_hook() -> Hook:
+    """Return a minimal primary hook."""
+    return CUSTOMER_HOOK
+
+
+@pytest.fixture(scope="module")
+def sample_source() -> Source:
+    """Return a relational source."""
+    return Source(relation="psa.customer")
+
+
+@pytest.fixture(scope="module")
+def sample_frame(sample_source: Source, sample_hook: Hook) -> Frame:
+    """Return a frame with one primary hook."""
+    return Frame.model_construct(
+        name="frame.customer", source=sample_source, description=None, hooks=(sample_hook,)
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_metadata() -> Metadata:
+    """Return metadata without a description."""
+    return Metadata(name="Test Manifest", created_at=NOW, updated_at=NOW)
+
+
+@pytest.fixture(scope="module")
+def sample_manifest(sample_metadata: Metadata, sample_frame: Frame) -> Manifest:
+    """Return a manifest with one frame and no concepts."""
+    return Manifest.model_construct(
+        manifest_version="1.0.0",
+        schema_version="1.0.0",
+        metadata=sample_metadata,
+        settings=Settings(),
+        frames=(sample_frame,),
+    )
+
+
+@pytest.fixture(scope="module")
+def hook_factory(sample_hook: Hook) -> Callable[..., Hook]:
+    """Return a builder for unvalidated copies of sample_hook with fields replaced."""
+
+    def make(**overrides: Any) -> Hook:
+        return sample_hook.model_copy(update=overrides)
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def concept_factory(sample_concept: Concept) -> Callable[..., Concept]:
+    """Return a builder for unvalidated copies of sample_concept with fields replaced."""
+
+    def make(**overrides: Any) -> Concept:
+        return sample_concept.model_copy(update=overrides)
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def frame_factory(sample_frame: Frame) -> Callable[..., Frame]:
+    """Return a builder for unvalidated copies of sample_frame with fields replaced."""
+
+    def make(**overrides: Any) -> Frame:
+        return sample_frame.model_copy(update=overrides)
+
+    return make
+
+
+# The large manifests are frozen and costly to build, so they are shared across the session
+def _manifest_shell(frames: list[Frame], concepts: list[Concept]) -> Manifest:
+    """Wrap frames and concepts in a manifest with default settings."""
+    return Manifest.model_construct(
+        manifest_version="1.0.0",
+        schema_version="1.0.0",
+        metadata=Metadata(name="Test Manifest", created_at=NOW, updated_at=NOW),
+        settings=Settings(),
+        frames=tuple(frames),
+        concepts=tuple(concepts),
+    )
+
+
+@pytest.fixture(scope="session")
+def many_concepts_manifest() -> Manifest:
+    """Return a manifest with 101 concepts, each used by a hook in one frame."""
+    hooks = tuple(
+        Hook(
+            name=f"_hk__concept_{i}",
+            role=HookRole.PRIMARY if i == 0 else HookRole.FOREIGN,
+            concept=f"concept_{i}",
+            source="SRC",
+            expr=f"id_{i}",
+        )
+        for i in range(101)
+    )
+    frame = Frame.model_construct(
+        name="frame.test", source=Source(relation="psa.test"), description=None, hooks=hooks
+    )
+    concepts = [
+        Concept(name=f"concept_{i}", description=f"Concept number {i} description")
+        for i in range(101)
+    ]
+    return _manifest_shell([frame], concepts)
+
+
+@pytest.fixture(scope="session")
+def many_frames_manifest() -> Manifest:
+    """Return a manifest with 51 single-hook frames over distinct sources."""
+    frames = [
+        Frame.model_construct(
+            name=f"frame.table_{i}",
+            source=Source(relation=f"psa.table_{i}"),
+            description=None,
+            hooks=(
+                Hook(
+                    name=f"_hk__entity_{i}",
+                    role=HookRole.PRIMARY,
+                    concept=f"entity_{i}",
+                    source="SRC",
+                    expr=f"id_{i}",
+                ),
+            ),
+        )
+        for i in range(51)
+    ]
+    return _manifest_shell(frames, [])
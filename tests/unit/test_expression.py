@@ -5,6 +5,9 @@ T018: Tests for expr validation (allowed tokens, forbidden patterns)
 
 import pytest
 
+from dot.core.expression import validate_expr
+from dot.models.diagnostic import Severity
+
 
 class TestExpressionValidation:
     """Tests for expr validation."""
@@ -71,8 +74,6 @@ class TestExpressionValidation:
     )
     def test_valid_expressions(self, expr: str) -> None:
         """Valid expressions return no diagnostics."""
-        from dot.core.expression import validate_expr
-
         diagnostics = validate_expr(expr)
         assert diagnostics == [], f"Expected no diagnostics for '{expr}', got {diagnostics}"
 
@@ -116,9 +117,6 @@ class TestExpressionValidation:
     )
     def test_forbidden_patterns(self, expr: str, expected_pattern: str) -> None:
         """Forbidden patterns return HOOK-006 diagnostic."""
-        from dot.core.expression import validate_expr
-        from dot.models.diagnostic import Severity
-
         diagnostics = validate_expr(expr)
         assert len(diagnostics) >= 1, f"Expected diagnostic for '{expr}'"
         assert diagnostics[0].rule_id == "HOOK-006"
@@ -131,9 +129,6 @@ class TestExpressionValidation:
 
     def test_empty_expression_fails(self) -> None:
         """Empty expression returns diagnostic."""
-        from dot.core.expression import validate_expr
-        from dot.models.diagnostic import Severity
-
         diagnostics = validate_expr("")
         assert len(diagnostics) == 1
         assert diagnostics[0].rule_id == "HOOK-006"
@@ -141,10 +136,50 @@ class TestExpressionValidation:
 
     def test_whitespace_only_expression_fails(self) -> None:
         """Whitespace-only expression returns diagnostic."""
-        from dot.core.expression import validate_expr
-        from dot.models.diagnostic import Severity
-
         diagnostics = validate_expr("   ")
         assert len(diagnostics) == 1
         assert diagnostics[0].rule_id == "HOOK-006"
         assert diagnostics[0].severity == Severity.ERROR
+
+    def test_empty_expression_diagnostics_are_per_call(self) -> None:
+        """Empty-expression diagnostics carry the caller's path and are not shared."""
+        first = validate_expr("\t\n", "frames[0].hooks[0].expr")
+        first.clear()
+        second = validate_expr("", "frames[1].hooks[0].expr")
+
+        assert len(second) == 1
+        assert second[0].path == "frames[1].hooks[0].expr"
+
+    def test_repeated_expression_reports_each_path(self) -> None:
+        """Repeated expressions (served from the memo) keep per-call paths."""
+        first = validate_expr("SELECT 1", "frames[0].hooks[0].expr")
+        second = validate_expr("SELECT 1", "frames[1].hooks[0].expr")
+
+        assert first[0].path == "frames[0].hooks[0].expr"
+        assert second[0].path == "frames[1].hooks[0].expr"
+        assert first[0].message == second[0].message
+
+    def test_forbidden_pattern_reported_by_priority(self) -> None:
+        """The first pattern in FORBIDDEN_PATTERNS order wins, not the first in the string."""
+        diagnostics = validate_expr("x FROM (SELECT y)")
+
+        assert "forbidden pattern: SELECT." in diagnostics[0].message
+
+    @pytest.mark.parametrize(
+        "expr,expected",
+        [
+            ("x GROUP\tBY y", "GROUP BY"),
+            ("x order\n  by y", "ORDER BY"),
+            ("group_by_key", None),
+            ("x GROUP, BY y", None),
+            ("selected_from", None),
+        ],
+    )
+    def test_forbidden_word_boundaries(self, expr: str, expected: str | None) -> None:
+        """Keywords match whole words only; two-word patterns allow only whitespace between."""
+        diagnostics = validate_expr(expr)
+
+        if expected is None:
+            assert diagnostics == []
+        else:
+            assert f"forbidden pattern: {expected}." in diagnostics[0].message
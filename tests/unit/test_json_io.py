@@ -3,16 +3,38 @@
 TDD - Write tests FIRST, must FAIL before implementation
 """
 
+import json
+from importlib.util import find_spec
 from pathlib import Path
-from textwrap import dedent
 
 import pytest
 
+from dot.io import json as json_io
 from dot.io.json import (
     dump_manifest_json,
     load_manifest_json,
     parse_json,
 )
+from dot.io.yaml import load_manifest_yaml
+from dot.models.manifest import Manifest
+
+pytestmark = pytest.mark.io
+
+# Constant JSON payloads, written with write_bytes
+_EMPTY_MANIFEST = (
+    b'{"manifest_version": "1.0.0", "schema_version": "1.0.0", "frames": [], "concepts": []}'
+)
+_CUSTOMER_MANIFEST = (
+    b'{"manifest_version": "1.0.0", "schema_version": "1.0.0",'
+    b' "frames": [{"name": "psa.customer", "source": {"relation": "psa.customer"},'
+    b' "hooks": [{"name": "_hk__customer", "role": "primary", "concept": "customer",'
+    b' "source": "CRM", "expr": "customer_id"}]}],'
+    b' "concepts": [{"name": "customer", "description": "A customer entity for testing"}]}'
+)
+_MANIFEST_WITH_UNKNOWN_FIELD = (
+    b'{"manifest_version": "1.0.0", "schema_version": "1.0.0", "frames": [], "concepts": [],'
+    b' "unknown_field": true}'
+)
 
 
 class TestJsonReader:
@@ -20,16 +42,8 @@ class TestJsonReader:
 
     def test_parse_valid_json_returns_dict(self, tmp_path: Path) -> None:
         """Parse valid JSON file returns dictionary."""
-        json_content = dedent("""\
-            {
-                "manifest_version": "1.0.0",
-                "schema_version": "1.0.0",
-                "frames": [],
-                "concepts": []
-            }
-        """)
         json_file = tmp_path / "test.json"
-        json_file.write_text(json_content)
+        json_file.write_bytes(_EMPTY_MANIFEST)
 
         result = parse_json(json_file)
 
@@ -38,35 +52,8 @@ class TestJsonReader:
 
     def test_load_manifest_json_returns_manifest(self, tmp_path: Path) -> None:
         """Load valid manifest JSON returns Manifest object."""
-        json_content = dedent("""\
-            {
-                "manifest_version": "1.0.0",
-                "schema_version": "1.0.0",
-                "frames": [
-                    {
-                        "name": "psa.customer",
-                        "source": {"relation": "psa.customer"},
-                        "hooks": [
-                            {
-                                "name": "_hk__customer",
-                                "role": "primary",
-                                "concept": "customer",
-                                "source": "CRM",
-                                "expr": "customer_id"
-                            }
-                        ]
-                    }
-                ],
-                "concepts": [
-                    {
-                        "name": "customer",
-                        "description": "A customer entity for testing"
-                    }
-                ]
-            }
-        """)
         json_file = tmp_path / "manifest.json"
-        json_file.write_text(json_content)
+        json_file.write_bytes(_CUSTOMER_MANIFEST)
 
         manifest = load_manifest_json(json_file)
 
@@ -76,17 +63,8 @@ class TestJsonReader:
 
     def test_load_manifest_json_with_raw_data(self, tmp_path: Path) -> None:
         """Load manifest returns both Manifest and raw dict."""
-        json_content = dedent("""\
-            {
-                "manifest_version": "1.0.0",
-                "schema_version": "1.0.0",
-                "frames": [],
-                "concepts": [],
-                "unknown_field": true
-            }
-        """)
         json_file = tmp_path / "manifest.json"
-        json_file.write_text(json_content)
+        json_file.write_bytes(_MANIFEST_WITH_UNKNOWN_FIELD)
 
         manifest, raw_data = load_manifest_json(json_file, return_raw=True)
 
@@ -100,7 +78,7 @@ class TestJsonParseErrors:
     def test_invalid_json_syntax_raises_error(self, tmp_path: Path) -> None:
         """Invalid JSON syntax raises JSONDecodeError."""
         json_file = tmp_path / "invalid.json"
-        json_file.write_text('{"invalid": json}')
+        json_file.write_bytes(b'{"invalid": json}')
 
         from json import JSONDecodeError
 
@@ -120,14 +98,12 @@ class TestJsonWriter:
 
     def test_dump_manifest_json_creates_file(self, tmp_path: Path) -> None:
         """Dump manifest to JSON creates valid JSON file."""
-        from dot.models.manifest import Manifest
-
         # Create a minimal manifest
         manifest = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            frames=[],
-            concepts=[],
+            frames=(),
+            concepts=(),
         )
 
         output_path = tmp_path / "output.json"
@@ -140,15 +116,11 @@ class TestJsonWriter:
 
     def test_dump_manifest_json_is_valid_json(self, tmp_path: Path) -> None:
         """Dumped JSON can be parsed back."""
-        import json
-
-        from dot.models.manifest import Manifest
-
         manifest = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            frames=[],
-            concepts=[],
+            frames=(),
+            concepts=(),
         )
 
         output_path = tmp_path / "output.json"
@@ -161,13 +133,11 @@ class TestJsonWriter:
 
     def test_dump_manifest_json_is_formatted(self, tmp_path: Path) -> None:
         """Dumped JSON is pretty-printed with indentation."""
-        from dot.models.manifest import Manifest
-
         manifest = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            frames=[],
-            concepts=[],
+            frames=(),
+            concepts=(),
         )
 
         output_path = tmp_path / "output.json"
@@ -180,16 +150,50 @@ class TestJsonWriter:
 
     def test_dump_manifest_returns_string_if_no_path(self) -> None:
         """Dump manifest without path returns JSON string."""
-        from dot.models.manifest import Manifest
-
         manifest = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            frames=[],
-            concepts=[],
+            frames=(),
+            concepts=(),
         )
 
         result = dump_manifest_json(manifest)
 
         assert isinstance(result, str)
         assert "manifest_version" in result
+
+
+class TestJsonBackends:
+    """Tests that the orjson fast path matches the stdlib json output.
+
+    orjson is in the test dependency group, so these never skip.
+    """
+
+    def test_orjson_and_stdlib_dumps_match(
+        self, valid_fixtures_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """dump_manifest_json output is identical with and without orjson."""
+        assert find_spec("orjson") is not None, "orjson is part of the test dependency group"
+
+        manifest = load_manifest_yaml(valid_fixtures_dir / "composite_grain.yaml")
+        with_orjson = dump_manifest_json(manifest)
+
+        monkeypatch.setattr(json_io, "orjson", None)
+
+        assert dump_manifest_json(manifest) == with_orjson
+
+    def test_orjson_and_stdlib_parse_match(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """parse_json returns the same data with and without orjson."""
+        assert find_spec("orjson") is not None, "orjson is part of the test dependency group"
+
+        json_file = tmp_path / "manifest.json"
+        json_file.write_text(
+            '{"name": "Kundå", "frames": [{"hooks": []}], "count": 3}', encoding="utf-8"
+        )
+        with_orjson = parse_json(json_file)
+
+        monkeypatch.setattr(json_io, "orjson", None)
+
+        assert parse_json(json_file) == with_orjson
@@ -3,10 +3,18 @@
 T015: Tests for all models (Settings, Diagnostic, Concept, Hook, Frame, Manifest)
 """
 
-from datetime import datetime, timezone
+from typing import Any
 
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel
+
+from dot.models.concept import Concept
+from dot.models.diagnostic import Diagnostic, Severity
+from dot.models.frame import Frame, Hook, HookRole, Source
+from dot.models.manifest import Manifest, Metadata
+from dot.models.settings import Settings
+
+from ._builders import NOW
 
 
 class TestSeverityEnum:
@@ -14,14 +22,10 @@ class TestSeverityEnum:
 
     def test_severity_error_value(self) -> None:
         """Severity.ERROR has value 'ERROR'."""
-        from dot.models.diagnostic import Severity
-
         assert Severity.ERROR.value == "ERROR"
 
     def test_severity_warn_value(self) -> None:
         """Severity.WARN has value 'WARN'."""
-        from dot.models.diagnostic import Severity
-
         assert Severity.WARN.value == "WARN"
 
 
@@ -30,8 +34,6 @@ class TestDiagnosticModel:
 
     def test_diagnostic_creation(self) -> None:
         """Diagnostic can be created with all required fields."""
-        from dot.models.diagnostic import Diagnostic, Severity
-
         diagnostic = Diagnostic(
             rule_id="HOOK-001",
             severity=Severity.ERROR,
@@ -45,28 +47,12 @@ class TestDiagnosticModel:
         assert diagnostic.path == "frames[0].hooks[0]"
         assert diagnostic.fix == "Add the required 'name' field"
 
-    def test_diagnostic_is_frozen(self) -> None:
-        """Diagnostic is immutable (frozen)."""
-        from dot.models.diagnostic import Diagnostic, Severity
-
-        diagnostic = Diagnostic(
-            rule_id="HOOK-001",
-            severity=Severity.ERROR,
-            message="Test",
-            path="test",
-            fix="Fix it",
-        )
-        with pytest.raises(ValidationError):
-            diagnostic.rule_id = "HOOK-002"  # type: ignore[misc]
-
 
 class TestSettingsModel:
     """Tests for Settings model."""
 
     def test_settings_defaults(self) -> None:
         """Settings use correct defaults."""
-        from dot.models.settings import Settings
-
         settings = Settings()
         assert settings.hook_prefix == "_hk__"
         assert settings.weak_hook_prefix == "_wk__"
@@ -74,8 +60,6 @@ class TestSettingsModel:
 
     def test_settings_custom_values(self) -> None:
         """Settings accept custom values."""
-        from dot.models.settings import Settings
-
         settings = Settings(
             hook_prefix="HK_",
             weak_hook_prefix="WK_",
@@ -85,70 +69,48 @@ class TestSettingsModel:
         assert settings.weak_hook_prefix == "WK_"
         assert settings.delimiter == "~"
 
-    def test_settings_is_frozen(self) -> None:
-        """Settings is immutable (frozen)."""
-        from dot.models.settings import Settings
-
-        settings = Settings()
-        with pytest.raises(ValidationError):
-            settings.hook_prefix = "changed"  # type: ignore[misc]
-
 
 class TestConceptModel:
     """Tests for Concept model."""
 
-    def test_concept_required_fields(self) -> None:
-        """Concept requires name and description."""
-        from dot.models.concept import Concept
-
-        concept = Concept(
-            name="customer",
-            description="A person or organization that purchases goods or services.",
-        )
-        assert concept.name == "customer"
-        assert concept.description == "A person or organization that purchases goods or services."
-
-    def test_concept_defaults(self) -> None:
-        """Concept has correct defaults for optional fields."""
-        from dot.models.concept import Concept
-
-        concept = Concept(
-            name="customer",
-            description="Test description",
-        )
-        assert concept.examples == ()
-        assert concept.frames == ()
-        assert concept.is_weak is False
-
-    def test_concept_with_examples(self) -> None:
-        """Concept accepts examples tuple."""
-        from dot.models.concept import Concept
-
-        concept = Concept(
-            name="customer",
-            description="Test description",
-            examples=("John Doe", "ACME Corp"),
-        )
-        assert concept.examples == ("John Doe", "ACME Corp")
-
-    def test_concept_is_weak(self) -> None:
-        """Concept is_weak can be set to True."""
-        from dot.models.concept import Concept
-
-        concept = Concept(
-            name="date",
-            description="A calendar date reference",
-            is_weak=True,
-        )
-        assert concept.is_weak is True
-
-    def test_concept_is_frozen(self) -> None:
-        """Concept is immutable (frozen)."""
-        from dot.models.concept import Concept
-
-        concept = Concept(name="customer", description="Test")
-        with pytest.raises(ValidationError):
-            concept.name = "changed"  # type: ignore[misc]
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {
+                    "name": "customer",
+                    "description": "A person or organization that purchases goods or services.",
+                },
+                {
+                    "name": "customer",
+                    "description": "A person or organization that purchases goods or services.",
+                },
+                id="required_fields",
+            ),
+            pytest.param(
+                {"name": "customer", "description": "Test description"},
+                {"examples": (), "frames": (), "is_weak": False},
+                id="defaults",
+            ),
+            pytest.param(
+                {
+                    "name": "customer",
+                    "description": "Test description",
+                    "examples": ("John Doe", "ACME Corp"),
+                },
+                {"examples": ("John Doe", "ACME Corp")},
+                id="with_examples",
+            ),
+            pytest.param(
+                {"name": "date", "description": "A calendar date reference", "is_weak": True},
+                {"is_weak": True},
+                id="is_weak",
+            ),
+        ],
+    )
+    def test_concept_construction(self, kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Concept stores given fields and fills optional ones with defaults."""
+        _assert_fields(Concept(**kwargs), expected)
 
 
 class TestHookRoleEnum:
@@ -156,229 +118,117 @@ class TestHookRoleEnum:
 
     def test_hook_role_primary(self) -> None:
         """HookRole.PRIMARY has value 'primary'."""
-        from dot.models.frame import HookRole
-
         assert HookRole.PRIMARY.value == "primary"
 
     def test_hook_role_foreign(self) -> None:
         """HookRole.FOREIGN has value 'foreign'."""
-        from dot.models.frame import HookRole
-
         assert HookRole.FOREIGN.value == "foreign"
 
 
 class TestHookModel:
     """Tests for Hook model."""
 
-    def test_hook_required_fields(self) -> None:
-        """Hook requires name, role, concept, source, expr."""
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_hk__customer",
-            role=HookRole.PRIMARY,
-            concept="customer",
-            source="CRM",
-            expr="customer_id",
-        )
-        assert hook.name == "_hk__customer"
-        assert hook.role == HookRole.PRIMARY
-        assert hook.concept == "customer"
-        assert hook.source == "CRM"
-        assert hook.expr == "customer_id"
-
-    def test_hook_missing_required_field(self) -> None:
-        """Hook raises error when required field is missing."""
-        from dot.models.frame import Hook, HookRole
-
-        with pytest.raises(ValidationError):
-            Hook(  # type: ignore[call-arg]
-                name="_hk__customer",
-                role=HookRole.PRIMARY,
-                # Missing: concept, source, expr - intentionally testing validation
-            )
-
-    def test_hook_optional_fields_default(self) -> None:
-        """Hook optional fields have correct defaults."""
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_hk__customer",
-            role=HookRole.PRIMARY,
-            concept="customer",
-            source="CRM",
-            expr="customer_id",
-        )
-        assert hook.qualifier is None
-        assert hook.tenant is None
-
-    def test_hook_with_qualifier(self) -> None:
-        """Hook accepts qualifier."""
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_hk__employee__manager",
-            role=HookRole.FOREIGN,
-            concept="employee",
-            qualifier="manager",
-            source="HR",
-            expr="manager_id",
-        )
-        assert hook.qualifier == "manager"
-
-    def test_hook_with_tenant(self) -> None:
-        """Hook accepts tenant."""
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_hk__order",
-            role=HookRole.PRIMARY,
-            concept="order",
-            source="SAP",
-            tenant="AU",
-            expr="order_id",
-        )
-        assert hook.tenant == "AU"
-
-    def test_hook_is_frozen(self) -> None:
-        """Hook is immutable (frozen)."""
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_hk__customer",
-            role=HookRole.PRIMARY,
-            concept="customer",
-            source="CRM",
-            expr="customer_id",
-        )
-        with pytest.raises(ValidationError):
-            hook.name = "changed"  # type: ignore[misc]
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {},
+                {
+                    "name": "_hk__customer",
+                    "role": HookRole.PRIMARY,
+                    "concept": "customer",
+                    "source": "CRM",
+                    "expr": "customer_id",
+                },
+                id="required_fields",
+            ),
+            pytest.param({}, {"qualifier": None, "tenant": None}, id="optional_fields_default"),
+            pytest.param(
+                {
+                    "name": "_hk__employee__manager",
+                    "role": HookRole.FOREIGN,
+                    "concept": "employee",
+                    "qualifier": "manager",
+                    "source": "HR",
+                    "expr": "manager_id",
+                },
+                {"qualifier": "manager"},
+                id="with_qualifier",
+            ),
+            pytest.param(
+                {
+                    "name": "_hk__order",
+                    "concept": "order",
+                    "source": "SAP",
+                    "tenant": "AU",
+                    "expr": "order_id",
+                },
+                {"tenant": "AU"},
+                id="with_tenant",
+            ),
+        ],
+    )
+    def test_hook_construction(self, kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Hook stores given fields (over a minimal primary hook) and defaults the rest."""
+        _assert_fields(Hook(**{**_HOOK_FIELDS, **kwargs}), expected)
 
 
 class TestSourceModel:
     """Tests for Source model."""
 
-    def test_source_with_relation(self) -> None:
-        """Source with relation only is valid."""
-        from dot.models.frame import Source
-
-        source = Source(relation="psa.customer")
-        assert source.relation == "psa.customer"
-        assert source.path is None
-
-    def test_source_with_path(self) -> None:
-        """Source with path only is valid."""
-        from dot.models.frame import Source
-
-        source = Source(path="//server/qvd/customer.qvd")
-        assert source.path == "//server/qvd/customer.qvd"
-        assert source.relation is None
-
-    def test_source_both_relation_and_path_fails(self) -> None:
-        """Source with both relation and path is invalid."""
-        from dot.models.frame import Source
-
-        with pytest.raises(ValidationError):
-            Source(relation="psa.customer", path="//server/qvd/customer.qvd")
-
-    def test_source_neither_relation_nor_path_fails(self) -> None:
-        """Source with neither relation nor path is invalid."""
-        from dot.models.frame import Source
-
-        with pytest.raises(ValidationError):
-            Source()
-
-    def test_source_is_frozen(self) -> None:
-        """Source is immutable (frozen)."""
-        from dot.models.frame import Source
-
-        source = Source(relation="psa.customer")
-        with pytest.raises(ValidationError):
-            source.relation = "changed"  # type: ignore[misc]
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {"relation": "psa.customer"},
+                {"relation": "psa.customer", "path": None},
+                id="with_relation",
+            ),
+            pytest.param(
+                {"path": "//server/qvd/customer.qvd"},
+                {"path": "//server/qvd/customer.qvd", "relation": None},
+                id="with_path",
+            ),
+        ],
+    )
+    def test_source_construction(self, kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Source with exactly one of relation or path is valid."""
+        _assert_fields(Source(**kwargs), expected)
 
 
 class TestFrameModel:
     """Tests for Frame model."""
 
-    def test_frame_required_fields(self) -> None:
+    def test_frame_required_fields(self, sample_source: Source, sample_hook: Hook) -> None:
         """Frame requires name, source, hooks."""
-        from dot.models.frame import Frame, Hook, HookRole, Source
-
-        frame = Frame(
-            name="frame.customer",
-            source=Source(relation="psa.customer"),
-            hooks=[
-                Hook(
-                    name="_hk__customer",
-                    role=HookRole.PRIMARY,
-                    concept="customer",
-                    source="CRM",
-                    expr="customer_id",
-                )
-            ],
-        )
+        frame = Frame(name="frame.customer", source=sample_source, hooks=(sample_hook,))
         assert frame.name == "frame.customer"
         assert frame.source.relation == "psa.customer"
         assert len(frame.hooks) == 1
 
-    def test_frame_optional_description(self) -> None:
+    def test_frame_optional_description(self, sample_frame: Frame) -> None:
         """Frame description is optional with default None."""
-        from dot.models.frame import Frame, Hook, HookRole, Source
+        assert sample_frame.description is None
 
-        frame = Frame(
-            name="frame.customer",
-            source=Source(relation="psa.customer"),
-            hooks=[
-                Hook(
-                    name="_hk__customer",
-                    role=HookRole.PRIMARY,
-                    concept="customer",
-                    source="CRM",
-                    expr="customer_id",
-                )
-            ],
-        )
-        assert frame.description is None
-
-    def test_frame_with_description(self) -> None:
+    def test_frame_with_description(self, sample_source: Source, sample_hook: Hook) -> None:
         """Frame accepts description."""
-        from dot.models.frame import Frame, Hook, HookRole, Source
-
         frame = Frame(
             name="frame.customer",
-            source=Source(relation="psa.customer"),
+            source=sample_source,
             description="Customer master data frame",
-            hooks=[
-                Hook(
-                    name="_hk__customer",
-                    role=HookRole.PRIMARY,
-                    concept="customer",
-                    source="CRM",
-                    expr="customer_id",
-                )
-            ],
+            hooks=(sample_hook,),
         )
         assert frame.description == "Customer master data frame"
 
-    def test_frame_is_frozen(self) -> None:
-        """Frame is immutable (frozen)."""
-        from dot.models.frame import Frame, Hook, HookRole, Source
-
+    def test_frame_is_hashable(self, sample_source: Source, sample_hook: Hook) -> None:
+        """Frame hooks are stored as a tuple, so frozen frames hash."""
         frame = Frame(
             name="frame.customer",
-            source=Source(relation="psa.customer"),
-            hooks=[
-                Hook(
-                    name="_hk__customer",
-                    role=HookRole.PRIMARY,
-                    concept="customer",
-                    source="CRM",
-                    expr="customer_id",
-                )
-            ],
+            source=sample_source,
+            hooks=[sample_hook],  # type: ignore[arg-type]
         )
-        with pytest.raises(ValidationError):
-            frame.name = "changed"  # type: ignore[misc]
+        assert isinstance(frame.hooks, tuple)
+        assert hash(frame) == hash(frame.model_copy())
 
 
 class TestMetadataModel:
@@ -386,87 +236,41 @@ class TestMetadataModel:
 
     def test_metadata_required_fields(self) -> None:
         """Metadata requires name, created_at, updated_at."""
-        from dot.models.manifest import Metadata
-
-        now = datetime.now(timezone.utc)
         metadata = Metadata(
             name="Test Manifest",
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
         assert metadata.name == "Test Manifest"
-        assert metadata.created_at == now
-        assert metadata.updated_at == now
+        assert metadata.created_at == NOW
+        assert metadata.updated_at == NOW
 
-    def test_metadata_optional_description(self) -> None:
+    def test_metadata_optional_description(self, sample_metadata: Metadata) -> None:
         """Metadata description is optional with default None."""
-        from dot.models.manifest import Metadata
-
-        now = datetime.now(timezone.utc)
-        metadata = Metadata(
-            name="Test Manifest",
-            created_at=now,
-            updated_at=now,
-        )
-        assert metadata.description is None
+        assert sample_metadata.description is None
 
     def test_metadata_with_description(self) -> None:
         """Metadata accepts description."""
-        from dot.models.manifest import Metadata
-
-        now = datetime.now(timezone.utc)
         metadata = Metadata(
             name="Test Manifest",
             description="A test manifest for validation",
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
         assert metadata.description == "A test manifest for validation"
 
-    def test_metadata_is_frozen(self) -> None:
-        """Metadata is immutable (frozen)."""
-        from dot.models.manifest import Metadata
-
-        now = datetime.now(timezone.utc)
-        metadata = Metadata(
-            name="Test Manifest",
-            created_at=now,
-            updated_at=now,
-        )
-        with pytest.raises(ValidationError):
-            metadata.name = "changed"  # type: ignore[misc]
-
 
 class TestManifestModel:
     """Tests for Manifest model."""
 
-    def test_manifest_required_fields(self) -> None:
+    def test_manifest_required_fields(self, sample_frame: Frame) -> None:
         """Manifest requires manifest_version, schema_version, metadata, settings, frames."""
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
         manifest = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
+            metadata=Metadata(name="Test", created_at=NOW, updated_at=NOW),
             settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                )
-            ],
+            frames=(sample_frame,),
         )
         assert manifest.manifest_version == "1.0.0"
         assert manifest.schema_version == "1.0.0"
@@ -475,101 +279,38 @@ class TestManifestModel:
         assert manifest.settings.hook_prefix == "_hk__"
         assert len(manifest.frames) == 1
 
-    def test_manifest_concepts_default(self) -> None:
+    def test_manifest_concepts_default(self, sample_manifest: Manifest) -> None:
         """Manifest concepts defaults to empty list."""
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                )
-            ],
-        )
-        assert manifest.concepts == []
+        assert sample_manifest.concepts == ()
 
-    def test_manifest_with_concepts(self) -> None:
+    def test_manifest_with_concepts(self, sample_manifest: Manifest) -> None:
         """Manifest accepts concepts list."""
-        from dot.models.concept import Concept
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
         manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                )
-            ],
-            concepts=[
-                Concept(
-                    name="customer",
-                    description="A person or organization that purchases goods",
-                )
-            ],
+            **{
+                **dict(sample_manifest),
+                "concepts": [
+                    Concept(
+                        name="customer",
+                        description="A person or organization that purchases goods",
+                    )
+                ],
+            }
         )
         assert len(manifest.concepts) == 1
         assert manifest.concepts[0].name == "customer"
 
-    def test_manifest_is_frozen(self) -> None:
-        """Manifest is immutable (frozen)."""
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
 
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                )
-            ],
-        )
-        with pytest.raises(ValidationError):
-            manifest.manifest_version = "2.0.0"  # type: ignore[misc]
+# Field values for a minimal valid primary hook (same as the sample_hook fixture)
+_HOOK_FIELDS: dict[str, Any] = {
+    "name": "_hk__customer",
+    "role": HookRole.PRIMARY,
+    "concept": "customer",
+    "source": "CRM",
+    "expr": "customer_id",
+}
+
+
+def _assert_fields(model: BaseModel, expected: dict[str, Any]) -> None:
+    """Assert each expected attribute of model equals the given value."""
+    for field, value in expected.items():
+        assert getattr(model, field) == value, field
@@ -0,0 +1,84 @@
+"""Unit tests for model validation failures and immutability.
+
+T015: Constructor and assignment errors for the Pydantic models. Kept apart
+from test_models.py, which covers successful construction and defaults.
+"""
+
+import re
+
+import pytest
+from pydantic import ValidationError
+
+from dot.models.frame import Hook, HookRole, Source
+from dot.models.manifest import Manifest
+
+# Pydantic error type for assignment to a frozen model; compiled once
+_FROZEN_ERROR = re.compile(r"type=frozen_instance")
+
+
+class TestHookValidation:
+    """Validation failures for Hook."""
+
+    def test_hook_missing_required_field(self) -> None:
+        """Hook raises error when required field is missing."""
+        with pytest.raises(ValidationError):
+            Hook(  # type: ignore[call-arg]
+                name="_hk__customer",
+                role=HookRole.PRIMARY,
+                # Missing: concept, source, expr - intentionally testing validation
+            )
+
+
+class TestSourceValidation:
+    """Validation failures for Source."""
+
+    def test_source_both_relation_and_path_fails(self) -> None:
+        """Source with both relation and path is invalid."""
+        with pytest.raises(ValidationError):
+            Source(relation="psa.customer", path="//server/qvd/customer.qvd")
+
+    def test_source_neither_relation_nor_path_fails(self) -> None:
+        """Source with neither relation nor path is invalid."""
+        with pytest.raises(ValidationError):
+            Source()
+
+
+class TestManifestValidation:
+    """Validation failures for Manifest."""
+
+    def test_manifest_version_must_be_string(self) -> None:
+        """Manifest rejects a non-string manifest_version with field info."""
+        parsed = {
+            "manifest_version": 123,  # int instead of string
+            "schema_version": "1.0.0",
+            "frames": [],
+            "concepts": [],
+        }
+
+        with pytest.raises(ValidationError, match="manifest_version"):
+            Manifest.model_validate(parsed)
+
+
+class TestFrozenModels:
+    """Every model is immutable (frozen)."""
+
+    @pytest.mark.parametrize(
+        "instance_name,field,value",
+        [
+            ("sample_diagnostic", "rule_id", "HOOK-002"),
+            ("sample_settings", "hook_prefix", "changed"),
+            ("sample_concept", "name", "changed"),
+            ("sample_hook", "name", "changed"),
+            ("sample_source", "relation", "changed"),
+            ("sample_frame", "name", "changed"),
+            ("sample_metadata", "name", "changed"),
+            ("sample_manifest", "manifest_version", "2.0.0"),
+        ],
+    )
+    def test_model_is_frozen(
+        self, request: pytest.FixtureRequest, instance_name: str, field: str, value: str
+    ) -> None:
+        """Assigning to a field raises a frozen_instance ValidationError."""
+        instance = request.getfixturevalue(instance_name)
+        with pytest.raises(ValidationError, match=_FROZEN_ERROR):
+            setattr(instance, field, value)
@@ -5,6 +5,14 @@ T016: Tests for naming validators (lower_snake_case, UPPER_SNAKE_CASE, hook_name
 
 import pytest
 
+from dot.core.normalization import (
+    is_lower_snake_case,
+    is_upper_snake_case,
+    is_valid_frame_name,
+    is_valid_hook_name,
+    is_valid_semver,
+)
+
 
 class TestLowerSnakeCase:
     """Tests for is_lower_snake_case validator."""
@@ -29,12 +37,12 @@ class TestLowerSnakeCase:
             ("customer_", True),  # Trailing underscore is allowed
             ("", False),
             ("1", False),
+            ("customer\n", False),  # Trailing newline
+            ("caf\u00e9", False),  # Non-ASCII letter
         ],
     )
     def test_lower_snake_case(self, value: str, expected: bool) -> None:
         """Test lower_snake_case pattern matching."""
-        from dot.core.normalization import is_lower_snake_case
-
         assert is_lower_snake_case(value) == expected
 
 
@@ -64,8 +72,6 @@ class TestUpperSnakeCase:
     )
     def test_upper_snake_case(self, value: str, expected: bool) -> None:
         """Test UPPER_SNAKE_CASE pattern matching."""
-        from dot.core.normalization import is_upper_snake_case
-
         assert is_upper_snake_case(value) == expected
 
 
@@ -99,8 +105,6 @@ class TestHookName:
     )
     def test_hook_name(self, value: str, expected: bool) -> None:
         """Test hook name pattern matching."""
-        from dot.core.normalization import is_valid_hook_name
-
         assert is_valid_hook_name(value) == expected
 
 
@@ -131,8 +135,6 @@ class TestFrameName:
     )
     def test_frame_name(self, value: str, expected: bool) -> None:
         """Test frame name pattern matching."""
-        from dot.core.normalization import is_valid_frame_name
-
         assert is_valid_frame_name(value) == expected
 
 
@@ -158,10 +160,11 @@ class TestSemver:
             ("", False),
             ("a.b.c", False),
             ("1.0.x", False),
+            ("1.0.0\n", False),  # Trailing newline
+            ("1..0", False),  # Empty component
+            ("\u0661.\u0660.\u0660", False),  # Non-ASCII digits
         ],
     )
     def test_semver(self, value: str, expected: bool) -> None:
         """Test semver pattern matching."""
-        from dot.core.normalization import is_valid_semver
-
         assert is_valid_semver(value) == expected
@@ -3,146 +3,105 @@
 T017: Tests for key set derivation, concept registry, hook registry
 """
 
-from datetime import datetime, timezone
+import pytest
 
+from dot.core.registry import (
+    _build_key_set,
+    derive_concepts,
+    derive_hook_registry,
+    derive_key_sets,
+    derive_registries,
+)
+from dot.models.frame import Frame, Hook, HookRole, Source
+from dot.models.manifest import Manifest, Metadata
+from dot.models.settings import Settings
 
-class TestKeySetDerivation:
-    """Tests for key set derivation functions."""
-
-    def test_build_key_set_simple(self) -> None:
-        """Key set for simple hook: CONCEPT@SOURCE."""
-        from dot.core.registry import _build_key_set
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_hk__customer",
-            role=HookRole.PRIMARY,
-            concept="customer",
-            source="CRM",
-            expr="customer_id",
-        )
-        key_set = _build_key_set(hook)
-        assert key_set == "CUSTOMER@CRM"
-
-    def test_build_key_set_with_qualifier(self) -> None:
-        """Key set with qualifier: CONCEPT~QUALIFIER@SOURCE."""
-        from dot.core.registry import _build_key_set
-        from dot.models.frame import Hook, HookRole
+from ._builders import NOW
 
-        hook = Hook(
-            name="_hk__employee__manager",
-            role=HookRole.FOREIGN,
-            concept="employee",
-            qualifier="manager",
-            source="HR",
-            expr="manager_id",
-        )
-        key_set = _build_key_set(hook)
-        assert key_set == "EMPLOYEE~MANAGER@HR"
-
-    def test_build_key_set_with_tenant(self) -> None:
-        """Key set with tenant: CONCEPT@SOURCE~TENANT."""
-        from dot.core.registry import _build_key_set
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_hk__order",
-            role=HookRole.PRIMARY,
-            concept="order",
-            source="SAP",
-            tenant="AU",
-            expr="order_id",
-        )
-        key_set = _build_key_set(hook)
-        assert key_set == "ORDER@SAP~AU"
-
-    def test_build_key_set_full(self) -> None:
-        """Key set with qualifier and tenant: CONCEPT~QUALIFIER@SOURCE~TENANT."""
-        from dot.core.registry import _build_key_set
-        from dot.models.frame import Hook, HookRole
+# Expected registry contents
+_CUSTOMER_ORDER_KEY_SETS = frozenset({"CUSTOMER@CRM", "ORDER@ERP"})
+_ORDER_ALIAS_KEY_SETS = frozenset({"ORDER~NUMBER@ERP", "ORDER~ID@ERP"})
+_ORDER_CONCEPTS = frozenset({"order", "customer", "employee"})
 
-        hook = Hook(
-            name="_hk__order__billing",
-            role=HookRole.FOREIGN,
-            concept="order",
-            qualifier="billing",
-            source="SAP",
-            tenant="EU",
-            expr="billing_order_id",
-        )
-        key_set = _build_key_set(hook)
-        assert key_set == "ORDER~BILLING@SAP~EU"
 
-    def test_derive_key_sets_from_manifest(self) -> None:
-        """Derive all unique key sets from manifest."""
-        from dot.core.registry import derive_key_sets
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
+class TestKeySetDerivation:
+    """Tests for key set derivation functions."""
 
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
+    @pytest.mark.parametrize(
+        "hook,expected",
+        [
+            pytest.param(
+                Hook(
+                    name="_hk__customer",
+                    role=HookRole.PRIMARY,
+                    concept="customer",
+                    source="CRM",
+                    expr="customer_id",
                 ),
-                Frame(
-                    name="frame.order",
-                    source=Source(relation="psa.order"),
-                    hooks=[
-                        Hook(
-                            name="_hk__order",
-                            role=HookRole.PRIMARY,
-                            concept="order",
-                            source="ERP",
-                            expr="order_id",
-                        ),
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.FOREIGN,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        ),
-                    ],
+                "CUSTOMER@CRM",
+                id="simple",
+            ),
+            pytest.param(
+                Hook(
+                    name="_hk__employee__manager",
+                    role=HookRole.FOREIGN,
+                    concept="employee",
+                    qualifier="manager",
+                    source="HR",
+                    expr="manager_id",
                 ),
-            ],
-        )
-        key_sets = derive_key_sets(manifest)
-        assert key_sets == {"CUSTOMER@CRM", "ORDER@ERP"}
+                "EMPLOYEE~MANAGER@HR",
+                id="with_qualifier",
+            ),
+            pytest.param(
+                Hook(
+                    name="_hk__order",
+                    role=HookRole.PRIMARY,
+                    concept="order",
+                    source="SAP",
+                    tenant="AU",
+                    expr="order_id",
+                ),
+                "ORDER@SAP~AU",
+                id="with_tenant",
+            ),
+            pytest.param(
+                Hook(
+                    name="_hk__order__billing",
+                    role=HookRole.FOREIGN,
+                    concept="order",
+                    qualifier="billing",
+                    source="SAP",
+                    tenant="EU",
+                    expr="billing_order_id",
+                ),
+                "ORDER~BILLING@SAP~EU",
+                id="full",
+            ),
+        ],
+    )
+    def test_build_key_set(self, hook: Hook, expected: str) -> None:
+        """Key set format: CONCEPT[~QUALIFIER]@SOURCE[~TENANT]."""
+        assert _build_key_set(hook) == expected
+
+    def test_derive_key_sets_from_manifest(self, customer_order_manifest: Manifest) -> None:
+        """Derive all unique key sets from manifest."""
+        key_sets = derive_key_sets(customer_order_manifest)
+        assert key_sets == _CUSTOMER_ORDER_KEY_SETS
+        assert isinstance(key_sets, frozenset)
 
     def test_derive_key_sets_with_aliases(self) -> None:
         """Derive key sets with key aliases (same concept, different qualifiers)."""
-        from dot.core.registry import derive_key_sets
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
         manifest = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
+            metadata=Metadata(name="Test", created_at=NOW, updated_at=NOW),
             settings=Settings(),
-            frames=[
+            frames=(
                 Frame(
                     name="frame.order",
                     source=Source(relation="psa.order"),
-                    hooks=[
+                    hooks=(
                         Hook(
                             name="_hk__order__number",
                             role=HookRole.PRIMARY,
@@ -159,12 +118,12 @@ class TestKeySetDerivation:
                             source="ERP",
                             expr="order_id",
                         ),
-                    ],
+                    ),
                 ),
-            ],
+            ),
         )
         key_sets = derive_key_sets(manifest)
-        assert key_sets == {"ORDER~NUMBER@ERP", "ORDER~ID@ERP"}
+        assert key_sets == _ORDER_ALIAS_KEY_SETS
 
 
 class TestConceptRegistry:
@@ -172,22 +131,16 @@ class TestConceptRegistry:
 
     def test_derive_concepts_from_hooks(self) -> None:
         """Derive unique concept names from all hooks."""
-        from dot.core.registry import derive_concepts
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
         manifest = Manifest(
             manifest_version="1.0.0",
             schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
+            metadata=Metadata(name="Test", created_at=NOW, updated_at=NOW),
             settings=Settings(),
-            frames=[
+            frames=(
                 Frame(
                     name="frame.order",
                     source=Source(relation="psa.order"),
-                    hooks=[
+                    hooks=(
                         Hook(
                             name="_hk__order",
                             role=HookRole.PRIMARY,
@@ -210,67 +163,20 @@ class TestConceptRegistry:
                             source="HR",
                             expr="manager_id",
                         ),
-                    ],
+                    ),
                 ),
-            ],
+            ),
         )
         concepts = derive_concepts(manifest)
-        assert concepts == {"order", "customer", "employee"}
+        assert concepts == _ORDER_CONCEPTS
 
 
 class TestHookRegistry:
     """Tests for hook registry derivation."""
 
-    def test_derive_hook_registry(self) -> None:
+    def test_derive_hook_registry(self, customer_order_manifest: Manifest) -> None:
         """Derive hook registry indexing hooks by name."""
-        from dot.core.registry import derive_hook_registry
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                ),
-                Frame(
-                    name="frame.order",
-                    source=Source(relation="psa.order"),
-                    hooks=[
-                        Hook(
-                            name="_hk__order",
-                            role=HookRole.PRIMARY,
-                            concept="order",
-                            source="ERP",
-                            expr="order_id",
-                        ),
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.FOREIGN,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        ),
-                    ],
-                ),
-            ],
-        )
-        registry = derive_hook_registry(manifest)
+        registry = derive_hook_registry(customer_order_manifest)
 
         # _hk__customer appears in both frames
         assert "_hk__customer" in registry
@@ -283,3 +189,78 @@ class TestHookRegistry:
         assert "_hk__order" in registry
         assert len(registry["_hk__order"]) == 1
         assert registry["_hk__order"][0][0] == "frame.order"
+
+
+class TestFusedRegistries:
+    """Tests for the single-pass derive_registries."""
+
+    def test_derive_registries_fused(self, customer_order_manifest: Manifest) -> None:
+        """derive_registries matches the three separate derivations."""
+        bundle = derive_registries(customer_order_manifest)
+
+        assert bundle.key_sets == derive_key_sets(customer_order_manifest)
+        assert bundle.concepts == derive_concepts(customer_order_manifest)
+        assert {name: list(entries) for name, entries in bundle.hooks.items()} == (
+            derive_hook_registry(customer_order_manifest)
+        )
+        assert [name for name, _ in bundle.hooks["_hk__customer"]] == [
+            "frame.customer",
+            "frame.order",
+        ]
+
+    def test_derive_registries_is_read_only(self, customer_order_manifest: Manifest) -> None:
+        """The bundle's hook registry cannot be mutated in place."""
+        bundle = derive_registries(customer_order_manifest)
+
+        with pytest.raises(TypeError):
+            bundle.hooks["_hk__new"] = ()  # type: ignore[index]
+        assert isinstance(bundle.hooks["_hk__customer"], tuple)
+
+
+@pytest.fixture(scope="module")
+def customer_order_manifest() -> Manifest:
+    """Return a manifest where _hk__customer appears in two frames.
+
+    Manifest is frozen, so the derivation tests share one instance.
+    """
+    return Manifest(
+        manifest_version="1.0.0",
+        schema_version="1.0.0",
+        metadata=Metadata(name="Test", created_at=NOW, updated_at=NOW),
+        settings=Settings(),
+        frames=(
+            Frame(
+                name="frame.customer",
+                source=Source(relation="psa.customer"),
+                hooks=(
+                    Hook(
+                        name="_hk__customer",
+                        role=HookRole.PRIMARY,
+                        concept="customer",
+                        source="CRM",
+                        expr="customer_id",
+                    ),
+                ),
+            ),
+            Frame(
+                name="frame.order",
+                source=Source(relation="psa.order"),
+                hooks=(
+                    Hook(
+                        name="_hk__order",
+                        role=HookRole.PRIMARY,
+                        concept="order",
+                        source="ERP",
+                        expr="order_id",
+                    ),
+                    Hook(
+                        name="_hk__customer",
+                        role=HookRole.FOREIGN,
+                        concept="customer",
+                        source="CRM",
+                        expr="customer_id",
+                    ),
+                ),
+            ),
+        ),
+    )
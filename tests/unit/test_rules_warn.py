@@ -3,433 +3,290 @@
 T020: Tests for all WARN rules (CONCEPT-W01, HOOK-W01, FRAME-W01/W02/W03, MANIFEST-W01/W02)
 """
 
-from datetime import datetime, timezone
-
-from dot.models.diagnostic import Severity
-
-
-class TestConceptWarnings:
-    """Tests for CONCEPT warning rules."""
-
-    def test_concept_w01_too_many_concepts(self) -> None:
-        """CONCEPT-W01: Warn if more than 100 concepts."""
-        from dot.core.rules import warn_concept_count
-        from dot.models.concept import Concept
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        # Create 101 concepts
-        concepts = [
-            Concept(name=f"concept_{i}", description=f"Concept number {i} description here")
-            for i in range(101)
-        ]
-        # Create hooks for all concepts to avoid CONCEPT-001 errors
-        hooks = [
-            Hook(
-                name=f"_hk__concept_{i}",
-                role=HookRole.PRIMARY if i == 0 else HookRole.FOREIGN,
-                concept=f"concept_{i}",
-                source="SRC",
-                expr=f"id_{i}",
-            )
-            for i in range(101)
-        ]
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.test",
-                    source=Source(relation="psa.test"),
-                    hooks=hooks,
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import pytest
+
+from dot.core.rules import (
+    warn_concept_count,
+    warn_duplicate_source,
+    warn_no_primary_only_foreign,
+    warn_too_many_frames,
+    warn_too_many_hooks,
+    warn_unknown_fields,
+    warn_weak_hook_mismatch,
+)
+from dot.core.validation import validate_manifest
+from dot.models.concept import Concept
+from dot.models.diagnostic import Diagnostic, Severity
+from dot.models.frame import Frame, Hook, HookRole, Source
+from dot.models.manifest import Manifest, Metadata
+from dot.models.settings import Settings
+
+from ._builders import CUSTOMER_HOOK, NOW
+
+_Rule = Callable[..., list[Diagnostic]]
+
+
+def _hook(**overrides: Any) -> Hook:
+    """Build an unvalidated copy of the shared customer hook with fields replaced."""
+    return CUSTOMER_HOOK.model_copy(update=overrides)
+
+
+# One primary and 20 foreign hooks over concept_<i>: one past the FRAME-W03
+# threshold. Tests slice it instead of rebuilding hooks.
+_NUMBERED_HOOKS = tuple(
+    _hook(
+        name=f"_hk__concept_{i}",
+        role=HookRole.PRIMARY if i == 0 else HookRole.FOREIGN,
+        concept=f"concept_{i}",
+        source="SRC",
+        expr=f"id_{i}",
+    )
+    for i in range(21)
+)
+_CUSTOMER_SOURCE = Source.model_construct(relation="psa.customer")
+_CUSTOMER_CONCEPT = Concept.model_construct(name="customer", description="A customer")
+
+
+def _frame(
+    name: str = "frame.customer",
+    relation: str | None = None,
+    hooks: tuple[Hook, ...] | None = None,
+) -> Frame:
+    """Build an unvalidated frame, defaulting to the customer frame with its primary hook."""
+    source = _CUSTOMER_SOURCE if relation is None else Source.model_construct(relation=relation)
+    return Frame.model_construct(name=name, source=source, hooks=hooks or (CUSTOMER_HOOK,))
+
+
+def _manifest(frames: list[Frame], concepts: Sequence[Concept] = ()) -> Manifest:
+    """Build an unvalidated manifest around the given frames and concepts."""
+    return Manifest.model_construct(
+        manifest_version="1.0.0",
+        schema_version="1.0.0",
+        metadata=Metadata.model_construct(name="Test", created_at=NOW, updated_at=NOW),
+        settings=Settings(),
+        frames=tuple(frames),
+        concepts=tuple(concepts),
+    )
+
+
+def _raw_manifest(**extra: Any) -> dict[str, Any]:
+    """Build raw manifest data with any extra top-level keys."""
+    return {
+        "manifest_version": "1.0.0",
+        "schema_version": "1.0.0",
+        "metadata": {"name": "Test"},
+        "settings": {},
+        "frames": [],
+        "concepts": [],
+        **extra,
+    }
+
+
+def _assert_warnings(diagnostics: list[Diagnostic], expected: list[str]) -> None:
+    """Assert diagnostics are WARNs with exactly the expected rule ids."""
+    assert [d.rule_id for d in diagnostics] == expected
+    assert all(d.severity is Severity.WARN for d in diagnostics)
+
+
+# (rule, positional args, expected rule ids) for cases built from plain models;
+# the threshold cases over the shared large manifests are separate tests below.
+_CASES = [
+    pytest.param(
+        warn_concept_count,
+        (_manifest([_frame()], [_CUSTOMER_CONCEPT]),),
+        [],
+        id="concept_w01_under_threshold_passes",
+    ),
+    pytest.param(
+        warn_weak_hook_mismatch,
+        (
+            _hook(name="_wk__customer", role=HookRole.FOREIGN),
+            "frames[0].hooks[0]",
+            {"customer": _CUSTOMER_CONCEPT},  # is_weak defaults to False
+        ),
+        ["HOOK-W01"],
+        id="hook_w01_prefix_mismatch",
+    ),
+    pytest.param(
+        warn_weak_hook_mismatch,
+        (
+            _hook(name="_wk__date", role=HookRole.FOREIGN, concept="date", source="SYS"),
+            "frames[0].hooks[0]",
+            {
+                "date": Concept.model_construct(
+                    name="date", description="A calendar date", is_weak=True
                 )
-            ],
-            concepts=concepts,
+            },
+        ),
+        [],
+        id="hook_w01_matching_prefix_passes",
+    ),
+    pytest.param(
+        warn_no_primary_only_foreign,
+        (
+            _frame(
+                "frame.lookup",
+                "psa.lookup",
+                (
+                    _hook(
+                        name="_hk__ref",
+                        role=HookRole.FOREIGN,
+                        concept="ref",
+                        source="SYS",
+                        expr="ref_id",
+                    ),
+                ),
+            ),
+            "frames[0]",
+        ),
+        ["FRAME-W01"],
+        id="frame_w01_no_primary_only_foreign",
+    ),
+    pytest.param(
+        warn_no_primary_only_foreign,
+        (_frame(), "frames[0]"),
+        [],
+        id="frame_w01_with_primary_passes",
+    ),
+    pytest.param(
+        warn_duplicate_source,
+        (
+            _manifest(
+                [
+                    _frame("frame.customer_v1"),
+                    _frame(
+                        "frame.customer_v2",
+                        hooks=(_hook(expr="cust_id"),),
+                    ),
+                ]
+            ),
+        ),
+        ["FRAME-W02"],
+        id="frame_w02_duplicate_source",
+    ),
+    pytest.param(
+        warn_duplicate_source,
+        (
+            _manifest(
+                [
+                    _frame(),
+                    _frame(
+                        "frame.order",
+                        "psa.order",
+                        (_hook(name="_hk__order", concept="order", source="ERP", expr="order_id"),),
+                    ),
+                ]
+            ),
+        ),
+        [],
+        id="frame_w02_unique_sources_passes",
+    ),
+    pytest.param(
+        warn_too_many_hooks,
+        (_frame("frame.test", "psa.test", _NUMBERED_HOOKS), "frames[0]"),
+        ["FRAME-W03"],
+        id="frame_w03_too_many_hooks",
+    ),
+    pytest.param(
+        warn_too_many_hooks,
+        (_frame("frame.test", "psa.test", _NUMBERED_HOOKS[:20]), "frames[0]"),
+        [],
+        id="frame_w03_at_threshold_passes",
+    ),
+    pytest.param(
+        warn_too_many_hooks,
+        (_frame(), "frames[0]"),
+        [],
+        id="frame_w03_under_threshold_passes",
+    ),
+    pytest.param(
+        warn_too_many_frames,
+        (_manifest([_frame()]),),
+        [],
+        id="manifest_w01_under_threshold_passes",
+    ),
+    pytest.param(
+        warn_unknown_fields,
+        (_raw_manifest(unknown_field="value"),),
+        ["MANIFEST-W02"],
+        id="manifest_w02_unknown_fields",
+    ),
+    pytest.param(
+        warn_unknown_fields,
+        (_raw_manifest(),),
+        [],
+        id="manifest_w02_no_unknown_fields_passes",
+    ),
+]
+
+
+@pytest.mark.parametrize("rule,args,expected", _CASES)
+def test_rule(rule: _Rule, args: tuple[Any, ...], expected: list[str]) -> None:
+    """Each WARN rule reports exactly the expected warnings for its case."""
+    _assert_warnings(rule(*args), expected)
+
+
+class TestThresholdWarnings:
+    """Tests for the count thresholds over the shared large manifests."""
+
+    def test_concept_w01_too_many_concepts(self, many_concepts_manifest: Manifest) -> None:
+        """CONCEPT-W01: Over 100 concepts warns."""
+        _assert_warnings(warn_concept_count(many_concepts_manifest), ["CONCEPT-W01"])
+
+    def test_concept_w01_at_threshold_passes(self, many_concepts_manifest: Manifest) -> None:
+        """CONCEPT-W01: Exactly 100 concepts does not warn."""
+        manifest = many_concepts_manifest.model_copy(
+            update={"concepts": many_concepts_manifest.concepts[:100]}
         )
-        diagnostics = warn_concept_count(manifest)
-
-        assert len(diagnostics) == 1
-        assert diagnostics[0].rule_id == "CONCEPT-W01"
-        assert diagnostics[0].severity == Severity.WARN
-
-    def test_concept_w01_under_threshold_passes(self) -> None:
-        """CONCEPT-W01: No warning if 100 or fewer concepts."""
-        from dot.core.rules import warn_concept_count
-        from dot.models.concept import Concept
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                )
-            ],
-            concepts=[
-                Concept(name="customer", description="A customer description"),
-            ],
+
+        _assert_warnings(warn_concept_count(manifest), [])
+
+    def test_manifest_w01_too_many_frames(self, many_frames_manifest: Manifest) -> None:
+        """MANIFEST-W01: Over 50 frames warns."""
+        _assert_warnings(warn_too_many_frames(many_frames_manifest), ["MANIFEST-W01"])
+
+    def test_manifest_w01_at_threshold_passes(self, many_frames_manifest: Manifest) -> None:
+        """MANIFEST-W01: Exactly 50 frames does not warn."""
+        manifest = many_frames_manifest.model_copy(
+            update={"frames": many_frames_manifest.frames[:50]}
         )
-        diagnostics = warn_concept_count(manifest)
-        assert diagnostics == []
+
+        _assert_warnings(warn_too_many_frames(manifest), [])
 
 
 class TestHookWarnings:
-    """Tests for HOOK warning rules."""
-
-    def test_hook_w01_prefix_mismatch(self) -> None:
-        """HOOK-W01: Warn if weak hook prefix but concept is_weak=False."""
-        from dot.core.rules import warn_weak_hook_mismatch
-        from dot.models.concept import Concept
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_wk__customer",  # Weak prefix
-            role=HookRole.FOREIGN,
-            concept="customer",
-            source="CRM",
-            expr="customer_id",
-        )
-        # Concept with is_weak=False
-        concepts = [Concept(name="customer", description="A customer", is_weak=False)]
-
-        diagnostics = warn_weak_hook_mismatch(hook, "frames[0].hooks[0]", concepts)
-
-        assert len(diagnostics) == 1
-        assert diagnostics[0].rule_id == "HOOK-W01"
-        assert diagnostics[0].severity == Severity.WARN
-
-    def test_hook_w01_matching_prefix_passes(self) -> None:
-        """HOOK-W01: No warning if prefix matches is_weak flag."""
-        from dot.core.rules import warn_weak_hook_mismatch
-        from dot.models.concept import Concept
-        from dot.models.frame import Hook, HookRole
-
-        hook = Hook(
-            name="_wk__date",  # Weak prefix
-            role=HookRole.FOREIGN,
-            concept="date",
-            source="SYS",
-            expr="date_id",
-        )
-        # Concept with is_weak=True
-        concepts = [Concept(name="date", description="A calendar date", is_weak=True)]
-
-        diagnostics = warn_weak_hook_mismatch(hook, "frames[0].hooks[0]", concepts)
-        assert diagnostics == []
-
-
-class TestFrameWarnings:
-    """Tests for FRAME warning rules."""
-
-    def test_frame_w01_no_primary_only_foreign(self) -> None:
-        """FRAME-W01: Warn if frame has only foreign hooks (no primary)."""
-        from dot.core.rules import warn_no_primary_only_foreign
-        from dot.models.frame import Frame, Hook, HookRole, Source
-
-        frame = Frame(
-            name="frame.lookup",
-            source=Source(relation="psa.lookup"),
-            hooks=[
-                Hook(
-                    name="_hk__ref",
-                    role=HookRole.FOREIGN,  # Only foreign
-                    concept="ref",
-                    source="SYS",
-                    expr="ref_id",
-                )
-            ],
-        )
-        diagnostics = warn_no_primary_only_foreign(frame, "frames[0]")
-
-        assert len(diagnostics) == 1
-        assert diagnostics[0].rule_id == "FRAME-W01"
-        assert diagnostics[0].severity == Severity.WARN
-
-    def test_frame_w01_with_primary_passes(self) -> None:
-        """FRAME-W01: No warning if frame has primary hook."""
-        from dot.core.rules import warn_no_primary_only_foreign
-        from dot.models.frame import Frame, Hook, HookRole, Source
-
-        frame = Frame(
-            name="frame.customer",
-            source=Source(relation="psa.customer"),
-            hooks=[
-                Hook(
-                    name="_hk__customer",
-                    role=HookRole.PRIMARY,
-                    concept="customer",
-                    source="CRM",
-                    expr="customer_id",
-                )
-            ],
-        )
-        diagnostics = warn_no_primary_only_foreign(frame, "frames[0]")
-        assert diagnostics == []
-
-    def test_frame_w02_duplicate_source(self) -> None:
-        """FRAME-W02: Warn if multiple frames use same source."""
-        from dot.core.rules import warn_duplicate_source
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer_v1",
-                    source=Source(relation="psa.customer"),  # Same source
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                ),
-                Frame(
-                    name="frame.customer_v2",
-                    source=Source(relation="psa.customer"),  # Same source!
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="cust_id",
-                        )
-                    ],
-                ),
+    """Tests for HOOK warning rules through validate_manifest."""
+
+    def test_hook_w01_uses_first_concept_definition(self) -> None:
+        """HOOK-W01: validate_manifest looks up the first definition of a concept."""
+        weak_hook = _hook(name="_wk__customer", role=HookRole.FOREIGN)
+        # Duplicate definitions: the first one (is_weak=False) wins
+        manifest = _manifest(
+            [_frame(hooks=(CUSTOMER_HOOK, weak_hook))],
+            [
+                Concept.model_construct(name="customer", is_weak=False),
+                Concept.model_construct(name="customer", is_weak=True),
             ],
         )
-        diagnostics = warn_duplicate_source(manifest)
-
-        assert len(diagnostics) == 1
-        assert diagnostics[0].rule_id == "FRAME-W02"
-        assert diagnostics[0].severity == Severity.WARN
-
-    def test_frame_w02_unique_sources_passes(self) -> None:
-        """FRAME-W02: No warning if all sources are unique."""
-        from dot.core.rules import warn_duplicate_source
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                ),
-                Frame(
-                    name="frame.order",
-                    source=Source(relation="psa.order"),  # Different source
-                    hooks=[
-                        Hook(
-                            name="_hk__order",
-                            role=HookRole.PRIMARY,
-                            concept="order",
-                            source="ERP",
-                            expr="order_id",
-                        )
-                    ],
-                ),
-            ],
-        )
-        diagnostics = warn_duplicate_source(manifest)
-        assert diagnostics == []
-
-    def test_frame_w03_too_many_hooks(self) -> None:
-        """FRAME-W03: Warn if frame has more than 20 hooks."""
-        from dot.core.rules import warn_too_many_hooks
-        from dot.models.frame import Frame, Hook, HookRole, Source
-
-        hooks = [
-            Hook(
-                name=f"_hk__concept_{i}",
-                role=HookRole.PRIMARY if i == 0 else HookRole.FOREIGN,
-                concept=f"concept_{i}",
-                source="SRC",
-                expr=f"id_{i}",
-            )
-            for i in range(21)  # 21 hooks
-        ]
-        frame = Frame(
-            name="frame.test",
-            source=Source(relation="psa.test"),
-            hooks=hooks,
-        )
-        diagnostics = warn_too_many_hooks(frame, "frames[0]")
-
-        assert len(diagnostics) == 1
-        assert diagnostics[0].rule_id == "FRAME-W03"
-        assert diagnostics[0].severity == Severity.WARN
-
-    def test_frame_w03_under_threshold_passes(self) -> None:
-        """FRAME-W03: No warning if 20 or fewer hooks."""
-        from dot.core.rules import warn_too_many_hooks
-        from dot.models.frame import Frame, Hook, HookRole, Source
-
-        frame = Frame(
-            name="frame.customer",
-            source=Source(relation="psa.customer"),
-            hooks=[
-                Hook(
-                    name="_hk__customer",
-                    role=HookRole.PRIMARY,
-                    concept="customer",
-                    source="CRM",
-                    expr="customer_id",
-                )
-            ],
-        )
-        diagnostics = warn_too_many_hooks(frame, "frames[0]")
-        assert diagnostics == []
-
-
-class TestManifestWarnings:
-    """Tests for MANIFEST warning rules."""
-
-    def test_manifest_w01_too_many_frames(self) -> None:
-        """MANIFEST-W01: Warn if more than 50 frames."""
-        from dot.core.rules import warn_too_many_frames
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        frames = [
-            Frame(
-                name=f"frame.table_{i}",
-                source=Source(relation=f"psa.table_{i}"),
-                hooks=[
-                    Hook(
-                        name=f"_hk__entity_{i}",
-                        role=HookRole.PRIMARY,
-                        concept=f"entity_{i}",
-                        source="SRC",
-                        expr=f"id_{i}",
-                    )
-                ],
-            )
-            for i in range(51)  # 51 frames
-        ]
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=frames,
-        )
-        diagnostics = warn_too_many_frames(manifest)
-
-        assert len(diagnostics) == 1
-        assert diagnostics[0].rule_id == "MANIFEST-W01"
-        assert diagnostics[0].severity == Severity.WARN
-
-    def test_manifest_w01_under_threshold_passes(self) -> None:
-        """MANIFEST-W01: No warning if 50 or fewer frames."""
-        from dot.core.rules import warn_too_many_frames
-        from dot.models.frame import Frame, Hook, HookRole, Source
-        from dot.models.manifest import Manifest, Metadata
-        from dot.models.settings import Settings
-
-        now = datetime.now(timezone.utc)
-        manifest = Manifest(
-            manifest_version="1.0.0",
-            schema_version="1.0.0",
-            metadata=Metadata(name="Test", created_at=now, updated_at=now),
-            settings=Settings(),
-            frames=[
-                Frame(
-                    name="frame.customer",
-                    source=Source(relation="psa.customer"),
-                    hooks=[
-                        Hook(
-                            name="_hk__customer",
-                            role=HookRole.PRIMARY,
-                            concept="customer",
-                            source="CRM",
-                            expr="customer_id",
-                        )
-                    ],
-                )
-            ],
+
+        diagnostics = validate_manifest(manifest)
+
+        assert [d.rule_id for d in diagnostics if d.rule_id == "HOOK-W01"] == ["HOOK-W01"]
+
+
+class TestScaffolds:
+    """Tests that the unvalidated builders above describe valid models."""
+
+    def test_manifest_validates(self) -> None:
+        """A manifest from the builders passes full Pydantic validation."""
+        manifest = _manifest(
+            [_frame(), _frame("frame.lookup", "psa.lookup", _NUMBERED_HOOKS[:3])],
+            [_CUSTOMER_CONCEPT],
         )
-        diagnostics = warn_too_many_frames(manifest)
-        assert diagnostics == []
-
-    def test_manifest_w02_unknown_fields(self) -> None:
-        """MANIFEST-W02: Warn on unknown fields for forward compatibility."""
-        from dot.core.rules import warn_unknown_fields
-
-        # Simulate raw data with unknown field
-        raw_data = {
-            "manifest_version": "1.0.0",
-            "schema_version": "1.0.0",
-            "metadata": {"name": "Test"},
-            "settings": {},
-            "frames": [],
-            "concepts": [],
-            "unknown_field": "value",  # Unknown!
-        }
-        diagnostics = warn_unknown_fields(raw_data)
-
-        assert len(diagnostics) == 1
-        assert diagnostics[0].rule_id == "MANIFEST-W02"
-        assert diagnostics[0].severity == Severity.WARN
-
-    def test_manifest_w02_no_unknown_fields_passes(self) -> None:
-        """MANIFEST-W02: No warning if no unknown fields."""
-        from dot.core.rules import warn_unknown_fields
-
-        raw_data = {
-            "manifest_version": "1.0.0",
-            "schema_version": "1.0.0",
-            "metadata": {"name": "Test"},
-            "settings": {},
-            "frames": [],
-            "concepts": [],
-        }
-        diagnostics = warn_unknown_fields(raw_data)
-        assert diagnostics == []
+
+        revalidated = Manifest.model_validate(manifest.model_dump())
+
+        assert revalidated == manifest
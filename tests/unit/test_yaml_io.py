@@ -3,106 +3,308 @@
 TDD - Write tests FIRST, must FAIL before implementation
 """
 
+import os
+import pickle
+import re
 from pathlib import Path
 from textwrap import dedent
+from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
 from dot.io.yaml import (
     ParseError,
+    _load_manifest_cached,
+    _parse_yaml_str,
+    _sidecar_path,
     load_manifest_yaml,
     parse_yaml,
 )
+from dot.models.manifest import Manifest
+
+pytestmark = pytest.mark.io
+
+# YAML documents shared by the tests, dedented once at import
+_VALID_YAML = dedent("""\
+    manifest_version: "1.0.0"
+    schema_version: "1.0.0"
+    frames: []
+    concepts: []
+""")
+_INVALID_SYNTAX_YAML = dedent("""\
+    manifest_version: "1.0.0"
+    frames:
+      - name: "test"
+        hooks:
+          - invalid: yaml: syntax
+""")
+_BAD_INDENT_YAML = dedent("""\
+    manifest_version: "1.0.0"
+    frames:
+        - name: test
+            hooks:  # bad indentation
+          - bad indent here
+""")
 
 
 class TestYamlReader:
     """Tests for YAML parsing and manifest loading."""
 
-    def test_parse_valid_yaml_returns_dict(self, tmp_path: Path) -> None:
+    def test_parse_valid_yaml_returns_dict(self, valid_yaml_file: Path) -> None:
         """Parse valid YAML file returns dictionary."""
-        yaml_content = dedent("""\
-            manifest_version: "1.0.0"
-            schema_version: "1.0.0"
-            frames: []
-            concepts: []
-        """)
-        yaml_file = tmp_path / "test.yaml"
-        yaml_file.write_text(yaml_content)
-
-        result = parse_yaml(yaml_file)
+        result = parse_yaml(valid_yaml_file)
 
         assert isinstance(result, dict)
         assert result["manifest_version"] == "1.0.0"
 
-    def test_parse_preserves_key_order(self, tmp_path: Path) -> None:
+    def test_parse_preserves_key_order(self, valid_yaml_file: Path) -> None:
         """YAML parsing preserves key order for ordered output."""
-        yaml_content = dedent("""\
-            manifest_version: "1.0.0"
-            schema_version: "1.0.0"
-            metadata:
-              name: "test"
-            frames: []
-            concepts: []
-        """)
-        yaml_file = tmp_path / "test.yaml"
-        yaml_file.write_text(yaml_content)
-
-        result = parse_yaml(yaml_file)
-        keys = list(result.keys())
-
-        assert keys[0] == "manifest_version"
-        assert keys[1] == "schema_version"
-        assert keys[2] == "metadata"
-
-    def test_load_manifest_yaml_returns_manifest(self, valid_manifest_path: Path) -> None:
+        result = parse_yaml(valid_yaml_file)
+
+        # Document order, not alphabetical
+        assert list(result.keys()) == ["manifest_version", "schema_version", "frames", "concepts"]
+
+    def test_load_manifest_yaml_returns_manifest(
+        self, loaded_minimal_manifest: tuple[Manifest, dict[str, Any]]
+    ) -> None:
         """Load valid manifest YAML returns Manifest object."""
-        manifest = load_manifest_yaml(valid_manifest_path)
+        manifest, _ = loaded_minimal_manifest
 
         assert manifest.manifest_version == "1.0.0"
         assert len(manifest.frames) > 0
         assert len(manifest.concepts) > 0
 
-    def test_load_manifest_yaml_also_returns_raw_data(self, valid_manifest_path: Path) -> None:
+    def test_load_manifest_yaml_also_returns_raw_data(
+        self, loaded_minimal_manifest: tuple[Manifest, dict[str, Any]]
+    ) -> None:
         """Load manifest returns both Manifest and raw dict for unknown field detection."""
-        manifest, raw_data = load_manifest_yaml(valid_manifest_path, return_raw=True)
+        manifest, raw_data = loaded_minimal_manifest
 
         assert manifest is not None
         assert isinstance(raw_data, dict)
         assert "manifest_version" in raw_data
 
+    def test_load_manifest_yaml_shares_repeated_hook_values(self) -> None:
+        """Equal hook source values across a file load as one str object."""
+        path = Path(__file__).parent.parent / "fixtures" / "valid" / "composite_grain.yaml"
+        manifest = load_manifest_yaml(path)
+
+        sources = [hook.source for hook in manifest.frames[0].hooks]
+        assert sources == ["ERP", "ERP", "ERP"]
+        assert sources[0] is sources[1] is sources[2]
+
+
+class TestYamlManifestCache:
+    """Tests for load_manifest_yaml memoization."""
+
+    def test_mutating_a_load_does_not_affect_the_next(self, valid_manifest_path: Path) -> None:
+        """A cached manifest cannot be changed in place by one caller."""
+        first = load_manifest_yaml(valid_manifest_path)
+        frame_count = len(first.frames)
+
+        with pytest.raises(AttributeError):
+            first.frames.clear()  # type: ignore[attr-defined]
+        with pytest.raises(ValidationError):
+            first.frames = ()  # type: ignore[misc]
+
+        second = load_manifest_yaml(valid_manifest_path)
+        assert len(second.frames) == frame_count
+        assert second == first
+
+    def test_raw_data_mutation_does_not_leak_into_cache(self, valid_manifest_path: Path) -> None:
+        """Mutating nested raw data does not change later loads of the same file."""
+        _, raw_data = load_manifest_yaml(valid_manifest_path, return_raw=True)
+        expected_name = raw_data["frames"][0]["hooks"][0]["name"]
+
+        raw_data["frames"][0]["hooks"][0]["name"] = "_hk__mutated"
+        raw_data["frames"].append({"name": "frame.extra"})
+
+        _, reloaded = load_manifest_yaml(valid_manifest_path, return_raw=True)
+        assert reloaded["frames"][0]["hooks"][0]["name"] == expected_name
+        assert len(reloaded["frames"]) == len(raw_data["frames"]) - 1
+
+    def test_modified_file_is_reloaded(self, tmp_path: Path) -> None:
+        """Editing a file invalidates its cache entry."""
+        yaml_file = tmp_path / "manifest.yaml"
+        yaml_file.write_text('manifest_version: "1.0.0"\nschema_version: "1.0.0"\nframes: []\n')
+        first = load_manifest_yaml(yaml_file)
+
+        yaml_file.write_text('manifest_version: "2.0.0"\nschema_version: "1.0.0"\nframes: []\n')
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = load_manifest_yaml(yaml_file)
+
+        assert first.manifest_version == "1.0.0"
+        assert second.manifest_version == "2.0.0"
+
+
+class _RaisesOnLoad:
+    """Pickles to a call that raises ValueError when unpickled."""
+
+    def __reduce__(self) -> tuple[type[int], tuple[str]]:
+        return int, ("not a number",)
+
+
+class TestYamlPickleSidecar:
+    """Tests for the opt-in DOT_YAML_CACHE pickle sidecar."""
+
+    @pytest.fixture
+    def cache_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Enable DOT_YAML_CACHE with a per-test user cache directory."""
+        monkeypatch.setenv("DOT_YAML_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        return tmp_path / "cache" / "dot-organize" / "manifests"
+
+    def test_sidecar_written_and_reused(
+        self,
+        tmp_path: Path,
+        cache_env: Path,
+        valid_manifest_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """DOT_YAML_CACHE=1 writes a sidecar to the user cache that later loads reuse."""
+        yaml_file = tmp_path / "manifest.yaml"
+        yaml_file.write_bytes(valid_manifest_path.read_bytes())
+
+        manifest = load_manifest_yaml(yaml_file)
+        assert len(list(cache_env.glob("*.pkl"))) == 1
+        assert not (tmp_path / "manifest.yaml.pkl").exists()
+
+        # Bypass the in-memory cache; the sidecar must not require re-parsing
+        _load_manifest_cached.cache_clear()
+        monkeypatch.setattr("dot.io.yaml._parse_yaml_str", _fail_parse)
+        assert load_manifest_yaml(yaml_file) == manifest
+
+    def test_sidecar_ignored_after_same_size_edit(self, tmp_path: Path, cache_env: Path) -> None:
+        """An edit that keeps size and mtime still misses the sidecar."""
+        yaml_file = tmp_path / "manifest.yaml"
+        yaml_file.write_text('manifest_version: "1.0.0"\nschema_version: "1.0.0"\nframes: []\n')
+        stat = yaml_file.stat()
+        load_manifest_yaml(yaml_file)
+
+        yaml_file.write_text('manifest_version: "2.0.0"\nschema_version: "1.0.0"\nframes: []\n')
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        _load_manifest_cached.cache_clear()
+
+        assert load_manifest_yaml(yaml_file).manifest_version == "2.0.0"
+
+    @pytest.mark.parametrize(
+        "attribute,value",
+        [
+            pytest.param("__version__", "999.0.0", id="other_dot_version"),
+            pytest.param("_schema_fingerprint", lambda: "other-schema", id="other_model_schema"),
+        ],
+    )
+    def test_sidecar_with_other_key_ignored(
+        self,
+        tmp_path: Path,
+        cache_env: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        attribute: str,
+        value: object,
+    ) -> None:
+        """A sidecar from another dot version or model schema is re-parsed, not trusted."""
+        yaml_file = tmp_path / "manifest.yaml"
+        yaml_file.write_text('manifest_version: "1.0.0"\nschema_version: "1.0.0"\nframes: []\n')
+        load_manifest_yaml(yaml_file)
+
+        monkeypatch.setattr(f"dot.io.yaml.{attribute}", value)
+        _load_manifest_cached.cache_clear()
+        monkeypatch.setattr("dot.io.yaml._parse_yaml_str", _fail_parse)
+
+        with pytest.raises(AssertionError, match="unexpected parse"):
+            load_manifest_yaml(yaml_file)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param(pickle.dumps(()), id="empty_tuple"),
+            pytest.param(pickle.dumps(("key",)), id="short_tuple"),
+            pytest.param(pickle.dumps(("a", "b", "c")), id="wrong_types"),
+            pytest.param(pickle.dumps({"not": "a tuple"}), id="not_a_tuple"),
+            pytest.param(pickle.dumps(("a", "b", "c"))[:-3], id="truncated"),
+            pytest.param(pickle.dumps(_RaisesOnLoad()), id="raises_value_error"),
+        ],
+    )
+    def test_malformed_sidecar_ignored(
+        self, tmp_path: Path, cache_env: Path, content: bytes
+    ) -> None:
+        """Sidecars that fail to load or have an unexpected shape are misses."""
+        yaml_file = tmp_path / "manifest.yaml"
+        yaml_file.write_text('manifest_version: "1.0.0"\nschema_version: "1.0.0"\nframes: []\n')
+        sidecar = _sidecar_path(yaml_file.resolve())
+        sidecar.parent.mkdir(parents=True)
+        sidecar.write_bytes(content)
+
+        assert load_manifest_yaml(yaml_file).manifest_version == "1.0.0"
+
+    def test_sidecar_write_failure_ignored(
+        self, tmp_path: Path, cache_env: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A pickling failure only costs the cache, not the load."""
+
+        def fail_dump(*args: object, **kwargs: object) -> None:
+            raise TypeError("cannot pickle")
+
+        monkeypatch.setattr(pickle, "dump", fail_dump)
+        yaml_file = tmp_path / "manifest.yaml"
+        yaml_file.write_text('manifest_version: "1.0.0"\nschema_version: "1.0.0"\nframes: []\n')
+
+        assert load_manifest_yaml(yaml_file).manifest_version == "1.0.0"
+        assert list(cache_env.iterdir()) == []
+
+    def test_no_sidecar_by_default(
+        self, tmp_path: Path, valid_manifest_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without DOT_YAML_CACHE no sidecar is written."""
+        monkeypatch.delenv("DOT_YAML_CACHE", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        yaml_file = tmp_path / "manifest.yaml"
+        yaml_file.write_bytes(valid_manifest_path.read_bytes())
+
+        load_manifest_yaml(yaml_file)
+
+        assert not (tmp_path / "cache").exists()
+
+
+def _fail_parse(text: str, source: Path | str) -> dict[str, Any]:
+    """Stand-in for _parse_yaml_str that fails if the YAML is re-parsed."""
+    raise AssertionError(f"unexpected parse of {source}")
+
 
 class TestYamlParseErrors:
     """Tests for YAML parse error handling with line/column info."""
 
-    def test_invalid_yaml_syntax_raises_parse_error(self, tmp_path: Path) -> None:
-        """Invalid YAML syntax raises ParseError with location."""
-        yaml_content = dedent("""\
-            manifest_version: "1.0.0"
-            frames:
-              - name: "test"
-                hooks:
-                  - invalid: yaml: syntax
-        """)
-        yaml_file = tmp_path / "invalid.yaml"
-        yaml_file.write_text(yaml_content)
-
-        with pytest.raises(ParseError) as exc_info:
-            parse_yaml(yaml_file)
-
-        error = exc_info.value
-        assert error.line is not None
-        assert error.column is not None
+    @pytest.mark.parametrize(
+        "yaml_content,match",
+        [
+            pytest.param(
+                _INVALID_SYNTAX_YAML,
+                r"<test> at line \d+, column \d+: ",
+                id="invalid_syntax_has_location",
+            ),
+            pytest.param("", r"<test> at line 1, column 1: Empty YAML file", id="empty_document"),
+            pytest.param(
+                "- a\n- b\n", r"Expected a mapping at the top level, got list", id="not_a_mapping"
+            ),
+            # The message should be more than a cryptic code
+            pytest.param(_BAD_INDENT_YAML, r".{10,}", id="bad_indentation_message_is_helpful"),
+        ],
+    )
+    def test_invalid_yaml_raises_parse_error(self, yaml_content: str, match: str) -> None:
+        """Invalid or empty YAML raises a ParseError with useful details."""
+        with pytest.raises(ParseError, match=match):
+            _parse_yaml_str(yaml_content, "<test>")
 
     def test_parse_error_includes_file_path(self, tmp_path: Path) -> None:
         """ParseError includes the file path that caused the error."""
         yaml_file = tmp_path / "bad.yaml"
         yaml_file.write_text("invalid: yaml: :")
 
-        with pytest.raises(ParseError) as exc_info:
+        with pytest.raises(ParseError, match=re.escape(str(yaml_file))):
             parse_yaml(yaml_file)
 
-        assert str(yaml_file) in str(exc_info.value)
-
     def test_file_not_found_raises_error(self, tmp_path: Path) -> None:
         """Non-existent file raises FileNotFoundError."""
         yaml_file = tmp_path / "nonexistent.yaml"
@@ -110,59 +312,23 @@ class TestYamlParseErrors:
         with pytest.raises(FileNotFoundError):
             parse_yaml(yaml_file)
 
-    def test_empty_file_raises_parse_error(self, tmp_path: Path) -> None:
-        """Empty YAML file raises ParseError."""
-        yaml_file = tmp_path / "empty.yaml"
-        yaml_file.write_text("")
-
-        with pytest.raises(ParseError):
-            parse_yaml(yaml_file)
-
-    def test_parse_error_message_is_helpful(self, tmp_path: Path) -> None:
-        """ParseError message includes helpful context."""
-        # Use invalid YAML that causes a parse error (duplicate key or bad indentation)
-        yaml_content = dedent("""\
-            manifest_version: "1.0.0"
-            frames:
-                - name: test
-                    hooks:  # bad indentation
-                  - bad indent here
-        """)
-        yaml_file = tmp_path / "bad.yaml"
-        yaml_file.write_text(yaml_content)
-
-        with pytest.raises(ParseError) as exc_info:
-            parse_yaml(yaml_file)
-
-        # Error message should be understandable
-        error_msg = str(exc_info.value)
-        assert len(error_msg) > 10  # Not just a cryptic message
-
-
-class TestYamlValidation:
-    """Tests for YAML validation against Pydantic models."""
-
-    def test_invalid_manifest_data_raises_validation_error(self, tmp_path: Path) -> None:
-        """Invalid manifest data raises validation error with field info."""
-        # Valid YAML syntax but invalid manifest data
-        yaml_content = dedent("""\
-            manifest_version: 123
-            schema_version: "1.0.0"
-            frames: []
-            concepts: []
-        """)
-        yaml_file = tmp_path / "invalid_data.yaml"
-        yaml_file.write_text(yaml_content)
-
-        # Should raise due to manifest_version being int instead of string
-        from pydantic import ValidationError
 
-        with pytest.raises(ValidationError):
-            load_manifest_yaml(yaml_file)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_manifest_path() -> Path:
     """Return path to a valid minimal manifest fixture."""
     fixture_path = Path(__file__).parent.parent / "fixtures" / "valid" / "minimal.yaml"
     return fixture_path
+
+
+@pytest.fixture(scope="session")
+def loaded_minimal_manifest(valid_manifest_path: Path) -> tuple[Manifest, dict[str, Any]]:
+    """Return the minimal manifest and its raw data, loaded once per session."""
+    return load_manifest_yaml(valid_manifest_path, return_raw=True)
+
+
+@pytest.fixture(scope="session")
+def valid_yaml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the valid YAML document once and return its path."""
+    path = tmp_path_factory.mktemp("yaml") / "valid.yaml"
+    path.write_text(_VALID_YAML)
+    return path